@@ -6,7 +6,7 @@ from typing import Any, List, cast
 
 from fastapi import APIRouter, Depends, HTTPException, Response, status
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload, selectinload
 
 from app.api.dependencies import get_current_user, require_role
 from app.core.database import get_db
@@ -52,7 +52,12 @@ async def list_announcements(
 ) -> List[AnnouncementRecord]:
     """Return announcements ordered by recency."""
 
-    rows = db.query(Announcement).order_by(Announcement.created_at.desc()).all()
+    rows = (
+        db.query(Announcement)
+        .options(selectinload(Announcement.author), raiseload("*"))
+        .order_by(Announcement.created_at.desc())
+        .all()
+    )
     return [_to_record(row) for row in rows]
 
 
@@ -1,8 +1,10 @@
 # app/api/auth_router.py
 from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel, EmailStr, Field
 from typing import Any, Optional, cast
 from sqlalchemy.orm import Session
+from app.api.dependencies import get_current_user
 from app.core.database import get_db
 from app.services.auth_service import auth_service
 from app.models import User, UserType
@@ -16,7 +18,7 @@ class UserRegisterRequest(BaseModel):
     phone_number: str = Field(..., min_length=10, max_length=20)
     email: Optional[EmailStr] = None
     password: str = Field(..., min_length=6)
-    address: Optional[str] = None
+    address: Optional[str] = Field(default=None, max_length=255)
 
 class AuthorityRegisterRequest(BaseModel):
     name: str = Field(..., min_length=2, max_length=255)
@@ -73,8 +75,11 @@ def serialize_user(user: User) -> UserResponse:
     )
 
 # Endpoints
+# The register and login handlers are plain ``def`` on purpose: bcrypt and the
+# SQLAlchemy session are blocking, so FastAPI runs them on its threadpool
+# instead of stalling the event loop for every other request.
 @router.post("/register/user", response_model=UserResponse)
-async def register_user(request: UserRegisterRequest, db: Session = Depends(get_db)):
+def register_user(request: UserRegisterRequest, db: Session = Depends(get_db)):
     """Register a new user"""
     try:
         result = auth_service.register_user(
@@ -98,7 +103,7 @@ async def register_user(request: UserRegisterRequest, db: Session = Depends(get_
         raise HTTPException(status_code=500, detail=f"Registration failed: {str(e)}")
 
 @router.post("/register/authority", response_model=UserResponse)
-async def register_authority(request: AuthorityRegisterRequest, db: Session = Depends(get_db)):
+def register_authority(request: AuthorityRegisterRequest, db: Session = Depends(get_db)):
     """Register a new authority"""
     try:
         result = auth_service.register_authority(
@@ -123,7 +128,7 @@ async def register_authority(request: AuthorityRegisterRequest, db: Session = De
         raise HTTPException(status_code=500, detail=f"Registration failed: {str(e)}")
 
 @router.post("/login", response_model=LoginResponse)
-async def login(request: LoginRequest, db: Session = Depends(get_db)):
+def login(request: LoginRequest, db: Session = Depends(get_db)):
     """Login for both users and authorities"""
     try:
         # Authenticate user
@@ -139,50 +144,61 @@ async def login(request: LoginRequest, db: Session = Depends(get_db)):
                 detail="Invalid credentials"
             )
 
-        # Create access token
-        user_type_enum = authenticated_user.user_type
-        if not isinstance(user_type_enum, UserType):
-            try:
-                user_type_enum = UserType(str(user_type_enum))
-            except ValueError:
-                user_type_enum = UserType.USER
-
-        token_data = {
-            "sub": str(authenticated_user.id),
-            "user_type": user_type_enum.value,
-            "phone": authenticated_user.phone_number,
-        }
-        access_token = auth_service.create_access_token(data=token_data)
-        
-        # Prepare user data based on type
-        user_type_value = user_type_enum.value
-
-        user_data = {
-            "id": authenticated_user.id,
-            "name": authenticated_user.name,
-            "phone_number": authenticated_user.phone_number,
-            "email": authenticated_user.email,
-            "address": authenticated_user.address,
-            "department": authenticated_user.department,
-            "position": authenticated_user.position,
-            "feedback_route": getattr(authenticated_user, "feedback_route", None),
-            "user_type": user_type_value,
-            "is_active": bool(getattr(authenticated_user, "is_active", False)),
-            "is_approved": bool(getattr(authenticated_user, "is_approved", False)),
-        }
-        
-        return LoginResponse(
-            message="Login successful",
-            token=access_token,
-            user_type=user_type_value,
-            user_data=user_data
-        )
+        return build_login_response(authenticated_user, "Login successful")
     
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Login failed: {str(e)}")
 
+@router.get("/session", response_model=LoginResponse)
+def resume_session(
+    current_user: User = Depends(get_current_user),
+    credentials: HTTPAuthorizationCredentials = Depends(HTTPBearer()),
+):
+    """Restore a session from a saved token without re-checking the password"""
+    return build_login_response(current_user, "Session restored", token=credentials.credentials)
+
+def build_login_response(user: User, message: str, token: Optional[str] = None) -> LoginResponse:
+    """Package the token and user details the frontend keeps in its session."""
+    user_type_enum = user.user_type
+    if not isinstance(user_type_enum, UserType):
+        try:
+            user_type_enum = UserType(str(user_type_enum))
+        except ValueError:
+            user_type_enum = UserType.USER
+
+    if token is None:
+        token_data = {
+            "sub": str(user.id),
+            "user_type": user_type_enum.value,
+            "phone": user.phone_number,
+        }
+        token = auth_service.create_access_token(data=token_data)
+
+    user_type_value = user_type_enum.value
+
+    user_data = {
+        "id": user.id,
+        "name": user.name,
+        "phone_number": user.phone_number,
+        "email": user.email,
+        "address": user.address,
+        "department": user.department,
+        "position": user.position,
+        "feedback_route": getattr(user, "feedback_route", None),
+        "user_type": user_type_value,
+        "is_active": bool(getattr(user, "is_active", False)),
+        "is_approved": bool(getattr(user, "is_approved", False)),
+    }
+
+    return LoginResponse(
+        message=message,
+        token=token,
+        user_type=user_type_value,
+        user_data=user_data
+    )
+
 @router.post("/verify-token")
 async def verify_token(token: str):
     """Verify if a token is valid"""
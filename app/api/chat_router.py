@@ -10,7 +10,7 @@ from sqlalchemy.orm import Session
 
 from app.api.dependencies import get_current_user
 from app.core.database import get_db
-from app.models import ChatMessage, User
+from app.models import ChatMessage, ChatSender, User
 from app.services.granite_llm import granite_llm
 
 router = APIRouter()
@@ -35,7 +35,7 @@ class ChatResponse(BaseModel):
 def _chat_to_dict(entry: ChatMessage) -> ChatMessageRecord:
     obj = cast(Any, entry)
     return ChatMessageRecord(
-        sender=obj.sender,
+        sender=obj.sender.value,
         message=obj.message,
         timestamp=obj.created_at,
     )
@@ -65,7 +65,7 @@ async def ask_question(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Message cannot be empty")
 
     try:
-        db.add(ChatMessage(user_id=int(cast(Any, current_user).id), sender="user", message=message))
+        db.add(ChatMessage(user_id=int(cast(Any, current_user).id), sender=ChatSender.USER, message=message))
         db.commit()
     except Exception as exc:  # pragma: no cover
         db.rollback()
@@ -77,7 +77,7 @@ async def ask_question(
         raise HTTPException(status_code=500, detail=f"Assistant error: {exc}")
 
     try:
-        db.add(ChatMessage(user_id=int(cast(Any, current_user).id), sender="assistant", message=response_text))
+        db.add(ChatMessage(user_id=int(cast(Any, current_user).id), sender=ChatSender.ASSISTANT, message=response_text))
         db.commit()
     except Exception as exc:  # pragma: no cover
         db.rollback()
@@ -1,16 +1,28 @@
 # Placeholder for eco_tips_router.py
+import asyncio
+
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from app.services.granite_llm import granite_llm
-from typing import Optional
+from typing import Dict, List, Optional
 
 router = APIRouter()
 
+MAX_BATCH_TOPICS = 12
+
 class EcoTipResponse(BaseModel):
     topic: str
     tips: str
     status: str
 
+class EcoTipBatchRequest(BaseModel):
+    topics: List[str]
+
+class EcoTipBatchResponse(BaseModel):
+    tips: Dict[str, str]
+    status: str
+
 @router.get("/generate", response_model=EcoTipResponse)
 async def get_eco_tips(topic: str = Query(..., description="Topic for eco-friendly tips")):
     """Generate eco-friendly tips for a specific topic"""
@@ -28,6 +40,35 @@ async def get_eco_tips(topic: str = Query(..., description="Topic for eco-friend
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating eco tips: {str(e)}")
 
+@router.get("/generate-stream")
+async def stream_eco_tips(topic: str = Query(..., description="Topic for eco-friendly tips")):
+    """Stream eco-friendly tips as plain text while the model generates them"""
+    if not topic.strip():
+        raise HTTPException(status_code=400, detail="Topic cannot be empty")
+    # A sync generator is iterated on Starlette's threadpool, so the blocking
+    # LLM client does not stall the event loop.
+    return StreamingResponse(granite_llm.stream_eco_tip(topic), media_type="text/plain; charset=utf-8")
+
+@router.post("/generate-batch", response_model=EcoTipBatchResponse)
+async def get_eco_tips_batch(request: EcoTipBatchRequest):
+    """Generate eco-friendly tips for several topics in one round trip"""
+    topics = list(dict.fromkeys(topic.strip() for topic in request.topics if topic.strip()))
+    if not topics:
+        raise HTTPException(status_code=400, detail="At least one topic is required")
+    if len(topics) > MAX_BATCH_TOPICS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_TOPICS} topics per batch")
+
+    try:
+        # The LLM client is blocking, so each prompt runs on a worker thread
+        # and the batch completes in roughly the time of the slowest topic.
+        tips = await asyncio.gather(
+            *(asyncio.to_thread(granite_llm.generate_eco_tip, topic) for topic in topics)
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error generating eco tips: {str(e)}")
+
+    return EcoTipBatchResponse(tips=dict(zip(topics, tips)), status="success")
+
 @router.get("/popular-topics")
 async def get_popular_topics():
     """Get list of popular eco-friendly topics"""
@@ -1,27 +1,30 @@
 """Feedback API router with role-based access and persistent storage."""
 from __future__ import annotations
 
+import csv
+import io
 from datetime import datetime
-from typing import Any, List, Optional, cast
+from typing import Any, Iterator, List, Optional, cast
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from pydantic import BaseModel, field_validator
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, field_validator
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
 
 from app.api.dependencies import get_current_user, require_role
-from app.core.database import get_db
+from app.core.database import get_db, get_sessionmaker
 from app.models import Feedback, FeedbackStatus, User, UserType
 
 router = APIRouter()
 
 
 class FeedbackCreateRequest(BaseModel):
-    category: str
+    category: str = Field(..., max_length=64)
     message: str
-    authority_type: Optional[str] = None
-    priority: Optional[str] = None
-    location: Optional[str] = None
+    authority_type: Optional[str] = Field(default=None, max_length=64)
+    priority: Optional[str] = Field(default=None, max_length=16)
+    location: Optional[str] = Field(default=None, max_length=200)
 
 
 class FeedbackUpdateRequest(BaseModel):
@@ -59,6 +62,37 @@ class FeedbackSummary(BaseModel):
     solved: int
 
 
+# Listings load both people in one extra IN-query each; any other lazy load
+# raises instead of silently issuing one SELECT per row.
+_LISTING_OPTIONS = (
+    selectinload(Feedback.user),
+    selectinload(Feedback.assigned_authority),
+    raiseload("*"),
+)
+
+
+# Rows fetched per round trip while streaming an export.
+_EXPORT_BATCH_ROWS = 1000
+
+
+def _authority_scope(authority: User) -> Any:
+    """Return the filter limiting feedback to what ``authority`` may manage.
+
+    ``None`` means unrestricted (the mayor's office sees everything).
+    """
+    authority_id = cast(Any, authority).id
+    route = getattr(authority, "feedback_route", None)
+    if route and route.strip().lower() == "mayor's office":
+        return None
+    if route:
+        return (
+            (Feedback.authority_id == authority_id)
+            | (Feedback.authority_type == route)
+            | (Feedback.authority_id.is_(None))
+        )
+    return (Feedback.authority_id == authority_id) | (Feedback.authority_id.is_(None))
+
+
 def _feedback_to_record(entry: Feedback) -> FeedbackRecord:
     obj = cast(Any, entry)
     citizen = getattr(obj, "user", None)
@@ -128,6 +162,7 @@ async def list_my_feedback(
 
     entries = (
         db.query(Feedback)
+        .options(*_LISTING_OPTIONS)
         .filter(Feedback.user_id == current_user.id)
         .order_by(Feedback.created_at.desc())
         .all()
@@ -143,28 +178,61 @@ async def list_feedback_for_authority(
 ) -> List[FeedbackRecord]:
     """Allow authorities to review and manage citizen feedback."""
 
-    query = db.query(Feedback).order_by(Feedback.created_at.desc())
+    query = db.query(Feedback).options(*_LISTING_OPTIONS).order_by(Feedback.created_at.desc())
     if status_filter:
         query = query.filter(Feedback.status == status_filter)
 
-    route = getattr(current_authority, "feedback_route", None)
-    if route and route.strip().lower() == "mayor's office":
-        entries = query.all()
-    elif route:
-        query = query.filter(
-            (Feedback.authority_id == current_authority.id)
-            | (Feedback.authority_type == route)
-            | (Feedback.authority_id.is_(None))
-        )
-        entries = query.all()
-    else:
-        query = query.filter(
-            (Feedback.authority_id == current_authority.id) | (Feedback.authority_id.is_(None))
-        )
-        entries = query.all()
+    scope = _authority_scope(current_authority)
+    if scope is not None:
+        query = query.filter(scope)
+    entries = query.all()
     return [_feedback_to_record(entry) for entry in entries]
 
 
+@router.get("/export")
+def export_feedback_csv(
+    status_filter: Optional[FeedbackStatus] = Query(default=None),
+    current_authority: User = Depends(require_role(UserType.AUTHORITY)),
+) -> StreamingResponse:
+    """Stream the feedback an authority manages as CSV, in constant memory."""
+
+    statement = select(Feedback).order_by(Feedback.created_at.desc())
+    if status_filter:
+        statement = statement.where(Feedback.status == status_filter)
+    scope = _authority_scope(current_authority)
+    if scope is not None:
+        statement = statement.where(scope)
+    # yield_per streams over an unbuffered cursor, which cannot share its
+    # connection with selectinload's follow-up queries; join the two
+    # many-to-one users into the same result instead.
+    statement = statement.options(
+        joinedload(Feedback.user),
+        joinedload(Feedback.assigned_authority),
+        raiseload("*"),
+    ).execution_options(yield_per=_EXPORT_BATCH_ROWS)
+
+    def rows() -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(FeedbackRecord.model_fields)
+        yield buffer.getvalue()
+        # The request's session may be closed before the body is sent, so
+        # the stream owns its own.
+        with get_sessionmaker()() as session:
+            for partition in session.scalars(statement).partitions():
+                buffer.seek(0)
+                buffer.truncate()
+                for entry in partition:
+                    writer.writerow(_feedback_to_record(entry).model_dump(mode="json").values())
+                yield buffer.getvalue()
+
+    return StreamingResponse(
+        rows(),
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="feedback.csv"'},
+    )
+
+
 @router.patch("/{feedback_id}", response_model=FeedbackRecord)
 async def update_feedback_status(
     feedback_id: int,
@@ -181,7 +249,10 @@ async def update_feedback_status(
     setattr(entry, "status", payload.status)
     setattr(entry, "authority_notes", payload.authority_notes)
     setattr(entry, "authority_id", current_authority.id)
-    setattr(entry, "updated_at", datetime.utcnow())
+    # Stamp explicitly: a PATCH repeating the same values changes no other
+    # column, so MySQL's ON UPDATE would not fire (and other engines have none).
+    # This is the only ORM write to the column.
+    setattr(entry, "updated_at", func.now())
 
     db.add(entry)
     db.commit()
@@ -197,19 +268,14 @@ async def feedback_statistics(
 ) -> FeedbackSummary:
     """Return aggregate counts for dashboard visualisations."""
 
-    total = db.query(func.count(Feedback.id)).scalar() or 0
-
-    def count_status(target: FeedbackStatus) -> int:
-        return (
-            db.query(func.count(Feedback.id))
-            .filter(Feedback.status == target)
-            .scalar()
-            or 0
-        )
+    # One pass over the status index instead of a COUNT per status.
+    counts = dict(
+        db.query(Feedback.status, func.count(Feedback.id)).group_by(Feedback.status).all()
+    )
 
     return FeedbackSummary(
-        total=total,
-        reported=count_status(FeedbackStatus.REPORTED),
-        in_process=count_status(FeedbackStatus.IN_PROCESS),
-        solved=count_status(FeedbackStatus.SOLVED),
+        total=sum(counts.values()),
+        reported=counts.get(FeedbackStatus.REPORTED, 0),
+        in_process=counts.get(FeedbackStatus.IN_PROCESS, 0),
+        solved=counts.get(FeedbackStatus.SOLVED, 0),
     )
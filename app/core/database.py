@@ -1,16 +1,24 @@
 # app/core/database.py
-from sqlalchemy import create_engine, inspect, text
-from sqlalchemy.engine import Engine
-from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
-from typing import Generator
+from __future__ import annotations
+
+import hashlib
+import os
+from functools import lru_cache
+from typing import TYPE_CHECKING, Generator
 
 from app.core.config import settings
-from app.models import Base
-from app.services.admin_bootstrap import ensure_seed_admin
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+    from sqlalchemy.engine.reflection import Inspector
+    from sqlalchemy.orm import Session, sessionmaker
+    from sqlalchemy.sql.elements import TextClause
 
 
 def _build_engine(database_url: str) -> Engine:
+    from sqlalchemy import create_engine
+    from sqlalchemy.pool import StaticPool
+
     if database_url.startswith("sqlite"):
         return create_engine(
             database_url,
@@ -18,32 +26,137 @@ def _build_engine(database_url: str) -> Engine:
             poolclass=StaticPool,
         )
 
+    # pool_pre_ping replaces dead connections ("MySQL server has gone away")
+    # before use; pool_timeout fails fast instead of queueing for 30s when the
+    # pool is exhausted. Reset-on-return stays "rollback" so no transaction
+    # state leaks between requests. The PyMySQL timeouts keep a stalled server
+    # from pinning a worker indefinitely.
     return create_engine(
         database_url,
         pool_pre_ping=True,
         pool_recycle=1800,
         pool_size=10,
         max_overflow=20,
+        pool_timeout=10,
+        pool_reset_on_return="rollback",
+        connect_args={
+            "charset": "utf8mb4",
+            "connect_timeout": 5,
+            "read_timeout": 30,
+            "write_timeout": 30,
+        },
+        future=True,
     )
 
 
 DATABASE_URL = settings.database_url
-engine = _build_engine(DATABASE_URL)
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Columns added to ``users`` after the initial release, as (name, column DDL).
+_USER_COLUMN_PATCHES: tuple[tuple[str, str], ...] = (
+    ("department", "department VARCHAR(255) NULL"),
+    ("position", "position VARCHAR(255) NULL"),
+    ("last_login", "last_login DATETIME(6) NULL"),
+    ("feedback_route", "feedback_route VARCHAR(255) NULL"),
+    ("is_approved", "is_approved TINYINT(1) NOT NULL DEFAULT 0"),
+)
+
+# Integer keys widened after release, as (table, column, MODIFY DDL).
+_WIDENED_KEYS: tuple[tuple[str, str, str], ...] = (
+    ("chat_messages", "id", "id BIGINT NOT NULL AUTO_INCREMENT"),
+    ("chat_messages_archive", "id", "id BIGINT NOT NULL"),
+)
+
+# Bump when _ensure_user_timestamp_defaults or other non-column fixes change.
+_SCHEMA_PATCH_VERSION = 6
+_SCHEMA_META_KEY = "users_patch"
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """Return the process-wide engine, creating it on first use."""
+    return _build_engine(DATABASE_URL)
+
+
+@lru_cache(maxsize=1)
+def get_sessionmaker() -> sessionmaker:
+    """Return the session factory bound to :func:`get_engine`."""
+    from sqlalchemy.orm import sessionmaker
+
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
 
 
 def init_db():
     """Initialize database - create all tables"""
+    from app.models import Base
+
+    engine = get_engine()
+    expected = _schema_hash()
+    if _stored_schema_hash(engine) == expected:
+        print("[OK] Database schema is up to date")
+        return
+
     Base.metadata.create_all(bind=engine)
-    _apply_schema_patches()
+    if _apply_schema_patches():
+        _store_schema_hash(engine, expected)
     print("[OK] Database tables created successfully")
 
 
+@lru_cache(maxsize=1)
+def _schema_hash() -> str:
+    """Fingerprint the ORM tables plus legacy patches the code expects."""
+    from app.models import Base
+
+    tables = sorted(
+        (
+            table.name,
+            tuple(sorted(column.name for column in table.columns)),
+            tuple(sorted(index.name for index in table.indexes)),
+        )
+        for table in Base.metadata.tables.values()
+    )
+    fingerprint = repr((tables, _USER_COLUMN_PATCHES, _WIDENED_KEYS, _SCHEMA_PATCH_VERSION))
+    return hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()
+
+
+def _stored_schema_hash(engine: Engine) -> str | None:
+    from sqlalchemy import text
+
+    try:
+        with engine.connect() as connection:
+            row = connection.execute(
+                text("SELECT v FROM _schema_meta WHERE k = :k"), {"k": _SCHEMA_META_KEY}
+            ).first()
+    except Exception:
+        # Table missing on first start (or unreadable): fall back to full checks.
+        return None
+    return row[0] if row else None
+
+
+def _store_schema_hash(engine: Engine, value: str) -> None:
+    from sqlalchemy import text
+
+    try:
+        with engine.begin() as connection:
+            connection.execute(
+                text(
+                    "CREATE TABLE IF NOT EXISTS _schema_meta "
+                    "(k VARCHAR(64) NOT NULL PRIMARY KEY, v VARCHAR(64) NOT NULL)"
+                )
+            )
+            connection.execute(text("DELETE FROM _schema_meta WHERE k = :k"), {"k": _SCHEMA_META_KEY})
+            connection.execute(
+                text("INSERT INTO _schema_meta (k, v) VALUES (:k, :v)"),
+                {"k": _SCHEMA_META_KEY, "v": value},
+            )
+    except Exception as exc:
+        print(f"[WARN] Failed to record schema version: {exc}")
+
+
 def _bootstrap_seed_accounts() -> None:
+    from app.services.admin_bootstrap import ensure_seed_admin
+
     try:
-        with SessionLocal() as session:
+        with get_sessionmaker()() as session:
             ensure_seed_admin(session)
     except Exception as exc:
         print(f"[WARN] Failed to ensure seed admin account: {exc}")
@@ -51,56 +164,294 @@ def _bootstrap_seed_accounts() -> None:
 
 def get_db() -> Generator[Session, None, None]:
     """Dependency to get database session"""
-    db = SessionLocal()
+    db = get_sessionmaker()()
     try:
         yield db
     finally:
         db.close()
 
 
-def _ensure_column(engine: Engine, table_name: str, column_name: str, ddl: str) -> None:
-    inspector = inspect(engine)
+@lru_cache(maxsize=None)
+def _inspector(engine: Engine) -> Inspector:
+    """Return a shared inspector so reflection results are reused per engine."""
+    from sqlalchemy import inspect
+
+    return inspect(engine)
+
+
+@lru_cache(maxsize=None)
+def _add_columns_statement(missing: frozenset[str]) -> TextClause:
+    """Build (once per distinct set) the combined ALTER for ``missing`` columns."""
+    from sqlalchemy import text
+
+    clauses = ", ".join(
+        f"ADD COLUMN {ddl}" for name, ddl in _USER_COLUMN_PATCHES if name in missing
+    )
+    return text(f"ALTER TABLE users {clauses}")
+
+
+def _apply_schema_patches() -> bool:
+    """Apply simple schema migrations for legacy databases.
+
+    Returns ``True`` when every patch is known to be in place.
+    """
+    engine = get_engine()
+    ok = True
+
     try:
-        columns = {col["name"] for col in inspector.get_columns(table_name)}
+        existing = {col["name"] for col in _inspector(engine).get_columns("users")}
     except Exception:
-        return
+        existing = None
+        ok = False
 
-    if column_name in columns:
-        return
+    if existing is not None:
+        missing = [name for name, _ in _USER_COLUMN_PATCHES if name not in existing]
+        if missing:
+            try:
+                with engine.begin() as connection:
+                    connection.execute(_add_columns_statement(frozenset(missing)))
+                for name in missing:
+                    print(f"[PATCH] Added missing column '{name}' to 'users' table")
+            except Exception as exc:
+                ok = False
+                print(f"[WARN] Failed to add columns ({', '.join(missing)}) to 'users': {exc}")
+            finally:
+                # The cached reflection no longer matches the altered table.
+                _inspector.cache_clear()
 
-    statement = text(f"ALTER TABLE {table_name} ADD COLUMN {ddl}")
-    try:
-        with engine.begin() as connection:
-            connection.execute(statement)
-        print(f"[PATCH] Added missing column '{column_name}' to '{table_name}' table")
-    except Exception as exc:
-        print(f"[WARN] Failed to add column '{column_name}' to '{table_name}': {exc}")
-
-
-def _apply_schema_patches() -> None:
-    """Apply simple schema migrations for legacy databases."""
-    _ensure_column(engine, "users", "department", "department VARCHAR(255) NULL")
-    _ensure_column(engine, "users", "position", "position VARCHAR(255) NULL")
-    _ensure_column(
-        engine,
-        "users",
-        "updated_at",
-        "updated_at DATETIME(6) NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6)",
-    )
-    _ensure_column(engine, "users", "last_login", "last_login DATETIME(6) NULL")
-    _ensure_column(engine, "users", "feedback_route", "feedback_route VARCHAR(255) NULL")
-    _ensure_column(engine, "users", "is_approved", "is_approved TINYINT(1) NOT NULL DEFAULT 0")
-    _ensure_user_timestamp_defaults()
+    ok = _ensure_indexes() and ok
+    ok = _ensure_enum_values() and ok
+    ok = _ensure_server_defaults() and ok
+    ok = _ensure_widened_keys() and ok
+    ok = _ensure_on_update_timestamps() and ok
+    return _ensure_user_timestamp_defaults() and ok
+
+
+def _ensure_indexes() -> bool:
+    """Create model indexes that ``create_all`` skipped on existing tables.
 
+    InnoDB builds secondary indexes online (in place, without blocking
+    writes), so this is safe to run against a live database.
+    """
+    from app.models import Base
 
-def _ensure_user_timestamp_defaults() -> None:
+    engine = get_engine()
+    ok = True
+    created = False
+    for table in Base.metadata.sorted_tables:
+        try:
+            existing = {index["name"] for index in _inspector(engine).get_indexes(table.name)}
+        except Exception:
+            ok = False
+            continue
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+            try:
+                with engine.begin() as connection:
+                    index.create(bind=connection)
+                created = True
+                print(f"[PATCH] Added index '{index.name}' to '{table.name}' table")
+            except Exception as exc:
+                ok = False
+                print(f"[WARN] Failed to add index '{index.name}' to '{table.name}': {exc}")
+    if created:
+        _inspector.cache_clear()
+    return ok
+
+
+def _ensure_enum_values() -> bool:
+    """Rewrite MySQL columns that should be ENUMs with the model's labels.
+
+    Enums used to be stored by member name (``'REPORTED'``). MODIFY maps the
+    existing rows onto the new labels through the column's case-insensitive
+    collation, so ``'REPORTED'`` becomes ``'reported'`` in place. Columns
+    that were plain VARCHARs (``chat_messages.sender``) convert the same way.
+    """
     if not DATABASE_URL.startswith("mysql"):
-        return
+        return True
+
+    from sqlalchemy import Enum, text
+
+    from app.models import Base
+
+    engine = get_engine()
+    ok = True
+    changed = False
+    for table in Base.metadata.sorted_tables:
+        enum_columns = [column for column in table.columns if isinstance(column.type, Enum)]
+        if not enum_columns:
+            continue
+        try:
+            reflected = {col["name"]: col["type"] for col in _inspector(engine).get_columns(table.name)}
+        except Exception:
+            ok = False
+            continue
+        for column in enum_columns:
+            if column.name not in reflected:
+                continue
+            current = getattr(reflected[column.name], "enums", None)
+            if current is not None and list(current) == list(column.type.enums):
+                continue
+            ddl = column.type.compile(dialect=engine.dialect)
+            null = "NULL" if column.nullable else "NOT NULL"
+            try:
+                with engine.begin() as connection:
+                    connection.execute(
+                        text(f"ALTER TABLE {table.name} MODIFY {column.name} {ddl} {null}")
+                    )
+                changed = True
+                print(f"[PATCH] Stored '{table.name}.{column.name}' enum by value")
+            except Exception as exc:
+                ok = False
+                print(f"[WARN] Failed to convert '{table.name}.{column.name}' enum: {exc}")
+    if changed:
+        _inspector.cache_clear()
+    return ok
 
+
+def _ensure_server_defaults() -> bool:
+    """Give existing MySQL columns the constant defaults the models declare.
+
+    Tables created before a column gained ``server_default`` have no DB-side
+    default, so inserts that omit the column would fail. ``ALTER COLUMN ...
+    SET DEFAULT`` only touches metadata and is safe to repeat. Function
+    defaults such as ``now()`` are handled by their own patches.
+    """
+    if not DATABASE_URL.startswith("mysql"):
+        return True
+
+    from sqlalchemy import text
+    from sqlalchemy.sql.elements import TextClause
+
+    from app.models import Base
+
+    engine = get_engine()
+    ok = True
+    for table in Base.metadata.sorted_tables:
+        clauses = []
+        for column in table.columns:
+            default = getattr(column.server_default, "arg", None)
+            if isinstance(default, TextClause):
+                clauses.append(f"ALTER COLUMN {column.name} SET DEFAULT {default.text}")
+            elif isinstance(default, str):
+                clauses.append(f"ALTER COLUMN {column.name} SET DEFAULT '{default}'")
+        if not clauses:
+            continue
+        try:
+            with engine.begin() as connection:
+                connection.execute(text(f"ALTER TABLE {table.name} {', '.join(clauses)}"))
+        except Exception as exc:
+            ok = False
+            print(f"[WARN] Failed to set column defaults on '{table.name}': {exc}")
+    return ok
+
+
+def _ensure_widened_keys() -> bool:
+    """Widen legacy INT keys listed in ``_WIDENED_KEYS`` to BIGINT on MySQL.
+
+    Changing the type rebuilds the table, so it only runs while the reflected
+    column is still narrower.
+    """
+    if not DATABASE_URL.startswith("mysql"):
+        return True
+
+    from sqlalchemy import BigInteger, text
+
+    engine = get_engine()
+    ok = True
+    changed = False
+    for table, name, ddl in _WIDENED_KEYS:
+        try:
+            columns = {col["name"]: col["type"] for col in _inspector(engine).get_columns(table)}
+            if isinstance(columns.get(name), BigInteger):
+                continue
+            with engine.begin() as connection:
+                connection.execute(text(f"ALTER TABLE {table} MODIFY {ddl}"))
+            changed = True
+            print(f"[PATCH] Widened '{table}.{name}' to BIGINT")
+        except Exception as exc:
+            ok = False
+            print(f"[WARN] Failed to widen '{table}.{name}': {exc}")
+    if changed:
+        _inspector.cache_clear()
+    return ok
+
+
+def _ensure_on_update_timestamps() -> bool:
+    """Let MySQL stamp every ``server_onupdate`` column on UPDATE.
+
+    ``ON UPDATE CURRENT_TIMESTAMP`` is MySQL's built-in touch trigger: ORM
+    updates leave the column out of the SET list entirely. The columns keep
+    whole-second precision (5 bytes rather than 8 for ``DATETIME(6)``).
+    """
+    if not DATABASE_URL.startswith("mysql"):
+        return True
+
+    from sqlalchemy import text
+
+    from app.models import Base
+
+    engine = get_engine()
+    database_name = engine.url.database
+    if not database_name:
+        return True
+
+    ok = True
+    for table in Base.metadata.sorted_tables:
+        for column in table.columns:
+            if column.server_onupdate is None:
+                continue
+            try:
+                with engine.connect() as connection:
+                    info = connection.execute(
+                        text(
+                            """
+                            SELECT EXTRA, DATETIME_PRECISION
+                            FROM information_schema.columns
+                            WHERE table_schema = :schema
+                              AND table_name = :table
+                              AND column_name = :column
+                            """
+                        ),
+                        {"schema": database_name, "table": table.name, "column": column.name},
+                    ).first()
+                if info is None:
+                    continue
+                extra, precision = info
+                if "on update" in (extra or "").lower() and not precision:
+                    continue
+                with engine.begin() as connection:
+                    connection.execute(
+                        text(
+                            f"UPDATE {table.name} SET {column.name} = NOW() "
+                            f"WHERE {column.name} IS NULL"
+                        )
+                    )
+                    connection.execute(
+                        text(
+                            f"ALTER TABLE {table.name} MODIFY {column.name} DATETIME NOT NULL "
+                            "DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"
+                        )
+                    )
+                print(f"[PATCH] '{table.name}.{column.name}' now updates itself")
+            except Exception as exc:
+                ok = False
+                print(f"[WARN] Failed to add ON UPDATE to '{table.name}.{column.name}': {exc}")
+    return ok
+
+
+def _ensure_user_timestamp_defaults() -> bool:
+    if not DATABASE_URL.startswith("mysql"):
+        return True
+
+    from sqlalchemy import text
+
+    engine = get_engine()
     try:
         database_name = engine.url.database
         if not database_name:
-            return
+            return True
 
         with engine.connect() as connection:
             column_info = connection.execute(
@@ -117,7 +468,7 @@ def _ensure_user_timestamp_defaults() -> None:
             ).mappings().first()
 
         if column_info and column_info.get("COLUMN_DEFAULT") and column_info.get("IS_NULLABLE") == "NO":
-            return
+            return True
 
         with engine.begin() as connection:
             connection.execute(text("UPDATE users SET created_at = NOW(6) WHERE created_at IS NULL"))
@@ -128,20 +479,128 @@ def _ensure_user_timestamp_defaults() -> None:
             )
     except Exception as exc:
         print(f"[WARN] Failed to enforce created_at default: {exc}")
+        return False
+    return True
+
+
+# Connections each process opens at startup. Kept small because every
+# uvicorn worker warms its own pool against the same max_connections.
+_WARM_CONNECTIONS = 2
+
+# Set by the launcher once it has run prepare() before starting workers.
+PREPARED_ENV = "SMARTCITY_DB_PREPARED"
 
 
-# Initialize database on import
-try:
-    init_db()
-    _bootstrap_seed_accounts()
-except Exception as e:
-    print("=" * 60)
-    print("[ERROR] Database Initialization Failed")
-    print("=" * 60)
-    print(f"Error: {str(e)}")
-    print("\nTroubleshooting Steps:")
-    print("1. Check if MySQL server is running")
-    print("2. Verify database exists and user has permissions")
-    print("3. Ensure DATABASE_URL in .env is correct")
-    print("4. Run test_db_connection.py to verify connection")
-    print("5. Check logs for detailed error messages")
+def _warm_pool(engine: Engine) -> None:
+    """Open a few pooled connections up front so early requests skip the handshake.
+
+    The connections are held together before being returned; opening and
+    closing one at a time would just recycle a single pooled connection.
+    """
+    size = getattr(engine.pool, "size", None)
+    if size is None:
+        return
+
+    connections = []
+    try:
+        for _ in range(min(size(), _WARM_CONNECTIONS)):
+            connections.append(engine.connect())
+    except Exception as exc:
+        print(f"[WARN] Connection pool warm-up stopped early: {exc}")
+    finally:
+        for connection in connections:
+            connection.close()
+
+
+# Rows per id range moved by _archive_chat_messages in one transaction.
+_ARCHIVE_BATCH_IDS = 10_000
+
+
+def _archive_chat_messages() -> None:
+    """Move old chat messages out of the live table.
+
+    The chat endpoints only read a user's most recent messages, so rows past
+    the retention window just grow ``ix_chat_user_created``. They are copied
+    to the model-defined ``chat_messages_archive`` and deleted in id-range
+    batches so no single transaction gets large. Columns are named
+    explicitly, so a drifted archive fails loudly instead of mapping by
+    position.
+    """
+    days = settings.chat_archive_after_days
+    if not days or not DATABASE_URL.startswith("mysql"):
+        return
+
+    from sqlalchemy import text
+
+    from app.models import ChatMessage
+
+    engine = get_engine()
+    params = {"days": int(days)}
+    cutoff = "created_at < NOW(6) - INTERVAL :days DAY"
+    columns = ", ".join(column.name for column in ChatMessage.__table__.columns)
+    try:
+        with engine.begin() as connection:
+            low, high = connection.execute(
+                text(f"SELECT MIN(id), MAX(id) FROM chat_messages WHERE {cutoff}"), params
+            ).one()
+        if low is None:
+            return
+
+        moved = 0
+        for start in range(low, high + 1, _ARCHIVE_BATCH_IDS):
+            batch = {**params, "lo": start, "hi": start + _ARCHIVE_BATCH_IDS}
+            where = f"id >= :lo AND id < :hi AND {cutoff}"
+            with engine.begin() as connection:
+                connection.execute(
+                    text(
+                        f"INSERT INTO chat_messages_archive ({columns}) "
+                        f"SELECT {columns} FROM chat_messages WHERE {where}"
+                    ),
+                    batch,
+                )
+                moved += connection.execute(
+                    text(f"DELETE FROM chat_messages WHERE {where}"), batch
+                ).rowcount
+        print(f"[OK] Archived {moved} chat messages older than {days} days")
+    except Exception as exc:
+        # Each batch commits on its own, so rows moved before the failure stay
+        # archived; the rest are retried on the next start.
+        print(f"[ERROR] Failed to archive old chat messages: {exc}")
+
+
+def prepare() -> None:
+    """Run the one-off steps: schema patches, seed accounts, chat archiving.
+
+    The launcher calls this once before starting uvicorn workers so they do
+    not all migrate the same tables concurrently.
+    """
+    try:
+        get_engine()
+        init_db()
+        _bootstrap_seed_accounts()
+        _archive_chat_messages()
+    except Exception as e:
+        print("=" * 60)
+        print("[ERROR] Database Initialization Failed")
+        print("=" * 60)
+        print(f"Error: {str(e)}")
+        print("\nTroubleshooting Steps:")
+        print("1. Check if MySQL server is running")
+        print("2. Verify database exists and user has permissions")
+        print("3. Ensure DATABASE_URL in .env is correct")
+        print("4. Run test_db_connection.py to verify connection")
+        print("5. Check logs for detailed error messages")
+
+
+def startup() -> None:
+    """Per-process database setup, called from the FastAPI lifespan.
+
+    Runs :func:`prepare` unless the launcher already did, then warms the
+    pool. Merely importing this module never opens a database connection.
+    """
+    if not os.environ.get(PREPARED_ENV):
+        prepare()
+    try:
+        _warm_pool(get_engine())
+    except Exception as exc:
+        print(f"[WARN] Connection pool warm-up failed: {exc}")
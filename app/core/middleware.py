@@ -0,0 +1,76 @@
+"""ASGI middleware shared by the API."""
+
+from __future__ import annotations
+
+import zlib
+
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Upper bound on an inflated request body, so a small gzip bomb cannot
+# exhaust memory.
+MAX_INFLATED_BODY = 20 * 1024 * 1024
+
+
+class GzipRequestMiddleware:
+    """Inflate request bodies sent with ``Content-Encoding: gzip``.
+
+    Starlette's ``GZipMiddleware`` only compresses responses; the frontend
+    gzips large policy uploads, so the body is decoded here before routing.
+    """
+
+    def __init__(self, app: ASGIApp, max_size: int = MAX_INFLATED_BODY) -> None:
+        self.app = app
+        self.max_size = max_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not _is_gzipped(scope):
+            await self.app(scope, receive, send)
+            return
+
+        chunks = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+
+        inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        try:
+            body = inflater.decompress(b"".join(chunks), self.max_size)
+        except zlib.error:
+            await PlainTextResponse("Invalid gzip request body", status_code=400)(scope, receive, send)
+            return
+        if inflater.unconsumed_tail:
+            await PlainTextResponse("Request body too large", status_code=413)(scope, receive, send)
+            return
+        if not inflater.eof:
+            await PlainTextResponse("Invalid gzip request body", status_code=400)(scope, receive, send)
+            return
+
+        headers = [
+            (name, value)
+            for name, value in scope["headers"]
+            if name not in (b"content-encoding", b"content-length")
+        ]
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+
+        delivered = False
+
+        async def receive_inflated() -> Message:
+            nonlocal delivered
+            if delivered:
+                return await receive()
+            delivered = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        await self.app(dict(scope, headers=headers), receive_inflated, send)
+
+
+def _is_gzipped(scope: Scope) -> bool:
+    for name, value in scope["headers"]:
+        if name == b"content-encoding":
+            return value.strip().lower() == b"gzip"
+    return False
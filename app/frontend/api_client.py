@@ -10,18 +10,31 @@ from app.core.config import settings
 
 API_BASE_URL = f"http://{settings.api_host}:{settings.api_port}/api"
 
+# Error bodies larger than this (e.g. proxy HTML pages) are not worth decoding.
+_MAX_ERROR_BODY = 4096
 
-def _auth_headers() -> Dict[str, str]:
-    token: Optional[str] = st.session_state.get("token")
+
+# Default for ``token`` arguments: read the logged-in user's token from session state.
+_SESSION_TOKEN: Any = object()
+
+
+def _auth_headers(token: Optional[str] = _SESSION_TOKEN) -> Dict[str, str]:
+    if token is _SESSION_TOKEN:
+        token = st.session_state.get("token")
     if token:
         return {"Authorization": f"Bearer {token}"}
     return {}
 
 
-def api_get(path: str, **kwargs: Any) -> requests.Response:
+def api_get(path: str, token: Optional[str] = _SESSION_TOKEN, **kwargs: Any) -> requests.Response:
+    """GET ``path`` from the API.
+
+    Pass ``token`` explicitly (captured on the script thread) when calling from
+    a worker thread; ``st.session_state`` is then never touched.
+    """
     headers = {
         "Accept": "application/json",
-        **_auth_headers(),
+        **_auth_headers(token),
         **kwargs.pop("headers", {}),
     }
     return requests.get(f"{API_BASE_URL}{path}", headers=headers, timeout=kwargs.pop("timeout", 15), **kwargs)
@@ -66,3 +79,15 @@ def api_delete(path: str, **kwargs: Any) -> requests.Response:
         **kwargs.pop("headers", {}),
     }
     return requests.delete(f"{API_BASE_URL}{path}", headers=headers, timeout=kwargs.pop("timeout", 15), **kwargs)
+
+
+def error_detail(response: requests.Response) -> str:
+    """Return the ``detail`` of a small JSON error body, or an empty string."""
+    content_type = response.headers.get("content-type", "")
+    if "application/json" not in content_type or len(response.content) >= _MAX_ERROR_BODY:
+        return ""
+    try:
+        detail = response.json().get("detail", "")
+    except Exception:
+        return ""
+    return str(detail) if detail else ""
@@ -1,13 +1,5 @@
 # Placeholder for __init__.py
-from . import (
-    chat_assistant,
-    announcements,
-    eco_tips,
-    feedback_form,
-    login_page,
-    policy_summarizer,
-    registration_page,
-)
+import importlib
 
 __all__ = [
     "chat_assistant",
@@ -18,3 +10,19 @@ __all__ = [
     "login_page",
     "registration_page",
 ]
+
+# Submodules are imported on first attribute access so that touching the
+# package does not drag in Streamlit, pandas and the HTTP client up front.
+_LAZY = {name: f".{name}" for name in __all__}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
@@ -0,0 +1,175 @@
+"""Stylesheets shared by frontend components, built once at import."""
+
+from __future__ import annotations
+
+import streamlit as st
+
+CHAT_CSS = """
+<style>
+.chat-bubble {
+    border-radius: 16px;
+    padding: 1rem 1.2rem;
+    margin-bottom: 0.7rem;
+    border: 1px solid rgba(148, 163, 184, 0.18);
+    background: rgba(15, 23, 42, 0.62);
+    box-shadow: 0 18px 44px rgba(8, 47, 73, 0.24);
+    color: #e2e8f0;
+    backdrop-filter: blur(16px);
+}
+.chat-bubble strong {
+    display: block;
+    font-size: 0.78rem;
+    letter-spacing: 0.12em;
+    text-transform: uppercase;
+    color: #cbd5f5;
+    margin-bottom: 0.35rem;
+}
+.chat-bubble--user {
+    background: linear-gradient(135deg, rgba(56,189,248,0.26), rgba(14,165,233,0.16));
+    border-color: rgba(56, 189, 248, 0.4);
+}
+.chat-bubble--assistant {
+    background: linear-gradient(135deg, rgba(34,197,94,0.3), rgba(22,163,74,0.16));
+    border-color: rgba(34, 197, 94, 0.4);
+}
+</style>
+"""
+
+APPROVAL_CSS = """
+<style>
+.approval-card {
+    background: rgba(15, 23, 42, 0.55);
+    border: 1px solid rgba(148, 163, 184, 0.25);
+    border-radius: 18px;
+    padding: 20px;
+    margin-bottom: 22px;
+    backdrop-filter: blur(16px);
+}
+.approval-card__header {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    margin-bottom: 12px;
+}
+.approval-card__header h3 {
+    margin: 0;
+    color: #f8fafc;
+}
+.approval-card__chip {
+    background: rgba(59, 130, 246, 0.25);
+    border: 1px solid rgba(59, 130, 246, 0.45);
+    color: #bfdbfe;
+    padding: 4px 10px;
+    border-radius: 9999px;
+    font-size: 0.85rem;
+}
+.approval-card__meta {
+    display: grid;
+    gap: 6px;
+    color: #cbd5f5;
+    font-size: 0.95rem;
+}
+</style>
+"""
+
+LOGIN_CSS = """
+<style>
+.login-container {
+    max-width: 500px;
+    margin: 0 auto;
+    padding: 2rem;
+}
+.login-header {
+    text-align: center;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    padding: 2rem;
+    border-radius: 15px;
+    margin-bottom: 2rem;
+    color: white;
+}
+.login-form {
+    background: rgba(255, 255, 255, 0.05);
+    padding: 2rem;
+    border-radius: 15px;
+    backdrop-filter: blur(10px);
+    border: 1px solid rgba(255, 255, 255, 0.1);
+}
+.stButton>button {
+    width: 100%;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    border: none;
+    padding: 0.75rem;
+    border-radius: 10px;
+    font-size: 1.1rem;
+    font-weight: bold;
+    margin-top: 1rem;
+}
+.stButton>button:hover {
+    opacity: 0.9;
+}
+.divider {
+    text-align: center;
+    margin: 1.5rem 0;
+    color: #888;
+}
+</style>
+"""
+
+REGISTRATION_CSS = """
+<style>
+.register-container {
+    max-width: 600px;
+    margin: 0 auto;
+    padding: 2rem;
+}
+.register-header {
+    text-align: center;
+    background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
+    padding: 2rem;
+    border-radius: 15px;
+    margin-bottom: 2rem;
+    color: white;
+}
+.register-form {
+    background: rgba(255, 255, 255, 0.05);
+    padding: 2rem;
+    border-radius: 15px;
+    backdrop-filter: blur(10px);
+    border: 1px solid rgba(255, 255, 255, 0.1);
+}
+.form-section {
+    margin-bottom: 1.5rem;
+    padding: 1rem;
+    background: rgba(255, 255, 255, 0.02);
+    border-radius: 10px;
+}
+.stButton>button {
+    width: 100%;
+    background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
+    color: white;
+    border: none;
+    padding: 0.75rem;
+    border-radius: 10px;
+    font-size: 1.1rem;
+    font-weight: bold;
+    margin-top: 1rem;
+}
+.info-box {
+    background: rgba(33, 150, 243, 0.1);
+    border-left: 4px solid #2196F3;
+    padding: 1rem;
+    border-radius: 5px;
+    margin: 1rem 0;
+}
+</style>
+"""
+
+
+def inject_css(css: str) -> None:
+    """Emit a prebuilt stylesheet for the current script run.
+
+    Streamlit removes elements that are not re-emitted during a rerun, so the
+    stylesheet has to be sent on every run; only the string is shared.
+    """
+    st.markdown(css, unsafe_allow_html=True)
@@ -1,72 +1,112 @@
 """Streamlit views for managing pending authority approvals."""
 from __future__ import annotations
 
+import html
+import string
 from typing import Any, Dict, List
 
 import streamlit as st
 
-from frontend.api_client import api_delete, api_get, api_patch
+from frontend.api_client import api_delete, api_get, api_patch, error_detail
+from frontend.components._css import APPROVAL_CSS, inject_css
 
 
 def _handle_response_error(response: Any, action: str) -> None:
     """Render a helpful error box when backend calls fail."""
-    detail = ""
-    try:
-        detail = response.json().get("detail", "")  # type: ignore[call-arg]
-    except Exception:
-        detail = ""
+    detail = error_detail(response)
     message = detail or f"Unable to {action}."
     st.error(f"❌ {message}")
 
 
+_CARD_TMPL = string.Template(
+    """
+    <div class="approval-card">
+        <div class="approval-card__header">
+            <h3>${name}</h3>
+            <span class="approval-card__chip">${position}</span>
+        </div>
+        <div class="approval-card__meta">
+            <div><strong>Feedback route:</strong> ${feedback_route}</div>
+            <div><strong>Phone:</strong> ${phone_number}</div>
+            <div><strong>Email:</strong> ${email}</div>
+            <div><strong>Created:</strong> ${created_at}</div>
+        </div>
+    </div>
+    """
+)
+_CARD_DEFAULTS = {
+    "name": "Unknown",
+    "position": "No position",
+    "feedback_route": "Not assigned",
+    "phone_number": "---",
+    "email": "---",
+    "created_at": "---",
+}
+
+
 def _render_authority_card(authority: Dict[str, Any]) -> None:
-    """Render a single approval card with action buttons."""
-    authority_id = authority.get("id")
-    if authority_id is None:
+    """Render the detail card for the currently selected authority."""
+    fields = {
+        key: html.escape(str(authority.get(key) or default))
+        for key, default in _CARD_DEFAULTS.items()
+    }
+    st.markdown(_CARD_TMPL.substitute(fields), unsafe_allow_html=True)
+
+
+def _render_pending_table(pending: List[Dict[str, Any]]) -> None:
+    """Render every pending authority as a single read-only table."""
+    rows = [
+        {
+            "ID": authority.get("id"),
+            "Name": authority.get("name") or "Unknown",
+            "Position": authority.get("position") or "No position",
+            "Feedback route": authority.get("feedback_route") or "Not assigned",
+            "Phone": authority.get("phone_number") or "---",
+            "Email": authority.get("email") or "---",
+            "Created": authority.get("created_at") or "---",
+        }
+        for authority in pending
+    ]
+    st.dataframe(rows, use_container_width=True, hide_index=True)
+
+
+def _render_approval_form(pending: List[Dict[str, Any]]) -> None:
+    """Render one approve/reject form acting on the selected authority."""
+    by_id = {authority["id"]: authority for authority in pending if authority.get("id") is not None}
+    if not by_id:
         return
 
-    with st.container():
-        st.markdown(
-            f"""
-            <div class="approval-card">
-                <div class="approval-card__header">
-                    <h3>{authority.get('name', 'Unknown')}</h3>
-                    <span class="approval-card__chip">{authority.get('position', 'No position')}</span>
-                </div>
-                <div class="approval-card__meta">
-                    <div><strong>Feedback route:</strong> {authority.get('feedback_route') or 'Not assigned'}</div>
-                    <div><strong>Phone:</strong> {authority.get('phone_number') or '---'}</div>
-                    <div><strong>Email:</strong> {authority.get('email') or '---'}</div>
-                    <div><strong>Created:</strong> {authority.get('created_at') or '---'}</div>
-                </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-
-        with st.form(f"approve_authority_{authority_id}"):
-            col_approve, col_reject = st.columns(2)
-            approve_clicked = col_approve.form_submit_button("✅ Approve", use_container_width=True)
-            reject_clicked = col_reject.form_submit_button("🗑️ Reject", use_container_width=True)
-
-            if approve_clicked:
-                response = api_patch(
-                    f"/auth/admin/authorities/{authority_id}/approve",
-                    json={"approve": True},
-                )
-                if response.status_code == 200:
-                    st.success("🎉 Authority approved successfully.")
-                    st.rerun()
-                else:
-                    _handle_response_error(response, "approve authority")
-
-            if reject_clicked:
-                response = api_delete(f"/auth/admin/authorities/{authority_id}")
-                if response.status_code == 204:
-                    st.warning("🚫 Authority registration rejected.")
-                    st.rerun()
-                else:
-                    _handle_response_error(response, "reject authority")
+    authority_id = st.selectbox(
+        "Target ID",
+        list(by_id),
+        format_func=lambda value: f"#{value} — {by_id[value].get('name') or 'Unknown'}",
+        key="approval_target_id",
+    )
+    _render_authority_card(by_id[authority_id])
+
+    with st.form("authority_approval_action"):
+        col_approve, col_reject = st.columns(2)
+        approve_clicked = col_approve.form_submit_button("✅ Approve", use_container_width=True)
+        reject_clicked = col_reject.form_submit_button("🗑️ Reject", use_container_width=True)
+
+        if approve_clicked:
+            response = api_patch(
+                f"/auth/admin/authorities/{authority_id}/approve",
+                json={"approve": True},
+            )
+            if response.status_code == 200:
+                st.success("🎉 Authority approved successfully.")
+                st.rerun()
+            else:
+                _handle_response_error(response, "approve authority")
+
+        if reject_clicked:
+            response = api_delete(f"/auth/admin/authorities/{authority_id}")
+            if response.status_code == 204:
+                st.warning("🚫 Authority registration rejected.")
+                st.rerun()
+            else:
+                _handle_response_error(response, "reject authority")
 
 
 def render_authority_approvals() -> None:
@@ -79,45 +119,7 @@ def render_authority_approvals() -> None:
         st.error("Admin privileges are required to view this page.")
         return
 
-    st.markdown(
-        """
-        <style>
-        .approval-card {
-            background: rgba(15, 23, 42, 0.55);
-            border: 1px solid rgba(148, 163, 184, 0.25);
-            border-radius: 18px;
-            padding: 20px;
-            margin-bottom: 22px;
-            backdrop-filter: blur(16px);
-        }
-        .approval-card__header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 12px;
-        }
-        .approval-card__header h3 {
-            margin: 0;
-            color: #f8fafc;
-        }
-        .approval-card__chip {
-            background: rgba(59, 130, 246, 0.25);
-            border: 1px solid rgba(59, 130, 246, 0.45);
-            color: #bfdbfe;
-            padding: 4px 10px;
-            border-radius: 9999px;
-            font-size: 0.85rem;
-        }
-        .approval-card__meta {
-            display: grid;
-            gap: 6px;
-            color: #cbd5f5;
-            font-size: 0.95rem;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    inject_css(APPROVAL_CSS)
 
     try:
         response = api_get("/auth/admin/authorities/pending")
@@ -142,5 +144,5 @@ def render_authority_approvals() -> None:
         "Review each request carefully. Approved accounts become active immediately and can access the dashboard."
     )
 
-    for authority in pending:
-        _render_authority_card(authority)
+    _render_pending_table(pending)
+    _render_approval_form(pending)
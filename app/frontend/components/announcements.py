@@ -8,17 +8,24 @@ from typing import Any
 
 import streamlit as st
 
-from app.frontend.api_client import api_get, api_post, api_delete
+from app.frontend.api_client import api_get, api_post, api_delete, error_detail
 
+_HEADER_TMPL = "**{title}**  \n_by {author} • {created}_"
 
-def _list_announcements() -> list[dict[str, Any]]:
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_announcements(user_id: int | None) -> list[dict[str, Any]]:
+    # ``user_id`` only scopes the cache entry; failures raise so they are not cached.
+    resp = api_get("/announcements/")
+    resp.raise_for_status()
+    return resp.json()
+
+
+def _list_announcements(user_id: int | None = None) -> list[dict[str, Any]]:
     try:
-        resp = api_get("/announcements/")
-        if resp.ok:
-            return resp.json()
+        return _fetch_announcements(user_id)
     except Exception:
-        pass
-    return []
+        return []
 
 
 def render_announcements() -> None:
@@ -48,28 +55,38 @@ def render_announcements() -> None:
                         resp = api_post("/announcements/", json=payload)
                         if resp.status_code == 201:
                             st.success("Announcement published")
+                            _fetch_announcements.clear()
                             st.session_state["_announcements_needs_refresh"] = True
                         else:
-                            st.error(resp.json().get("detail", "Failed to publish"))
+                            st.error(error_detail(resp) or "Failed to publish")
 
-    rows = _list_announcements()
     if refresh_needed:
-        rows = _list_announcements()
+        _fetch_announcements.clear()
+    rows = _list_announcements(user_id)
     if not rows:
         st.info("No announcements published yet.")
         return
 
+    user_is_authority = user_type == "authority"
+    authority_and_mayor = user_is_authority and is_mayor_route
+
     for a in rows:
-        header = f"**{a.get('title')}**  \n_by {a.get('author_name') or 'Unknown'} • {a.get('created_at')}_"
+        aid = a.get("id")
+        author_id = a.get("author_id")
+        header = _HEADER_TMPL.format(
+            title=a.get("title"),
+            author=a.get("author_name") or "Unknown",
+            created=a.get("created_at"),
+        )
         st.markdown(header)
         st.write(a.get("content"))
-        if user_type == "authority":
-            author_id = a.get("author_id")
-            can_delete = (author_id == user_id) or is_mayor_route
-            if can_delete and st.button(f"Delete {a.get('id')}", key=f"del_{a.get('id')}"):
-                resp = api_delete(f"/announcements/{a.get('id')}")
+        if user_is_authority:
+            can_delete = authority_and_mayor or author_id == user_id
+            if can_delete and st.button(f"Delete {aid}", key=f"del_{aid}"):
+                resp = api_delete(f"/announcements/{aid}")
                 if resp.status_code in (200, 204):
                     st.success("Deleted")
+                    _fetch_announcements.clear()
                     st.session_state["_announcements_needs_refresh"] = True
                     st.experimental_rerun()
                 else:
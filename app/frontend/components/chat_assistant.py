@@ -1,112 +1,279 @@
 # Streamlit chat assistant component with persistent history support.
 from __future__ import annotations
 
-import html
-import json
-from datetime import datetime
+import importlib
+import threading
+import time
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
-import streamlit as st
+# Streamlit, the HTTP client and the stdlib helpers below are imported inside
+# the functions that need them so importing this module stays cheap.
 
-from app.frontend.api_client import api_delete, api_get, api_post
+# Modules imported in the background once the chat UI has painted, so that the
+# next page the user opens does not pay their cold-import cost.
+_PRELOAD_MODULES = (
+    "pandas",
+    "app.frontend.components.feedback_form",
+    "app.frontend.components.eco_tips",
+    "app.frontend.components.announcements",
+)
+_preload_lock = threading.Lock()
+_preload_started = False
+
+
+def _preload_modules() -> None:
+    for name in _PRELOAD_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass
+
+
+def _start_background_preload() -> None:
+    """Import slow modules on a daemon thread, at most once per process."""
+    global _preload_started
+
+    from app.core.config import settings
+
+    if not settings.frontend_preload:
+        return
+    with _preload_lock:
+        if _preload_started:
+            return
+        _preload_started = True
+    threading.Thread(target=_preload_modules, name="chat-preload", daemon=True).start()
 
 
 def _current_user_id() -> Optional[int]:
+    import streamlit as st
+
     user_data = st.session_state.get("user_data")
     if isinstance(user_data, dict):
         return user_data.get("id")
     return None
 
 
-def _load_persisted_history(user_id: int) -> List[Dict[str, Any]]:
+# Saved histories are reused across reruns and sessions for this many seconds.
+_HISTORY_TTL = 300
+# How long a rerun waits before checking an in-flight history fetch again.
+_HISTORY_POLL_SECONDS = 0.3
+_history_lock = threading.Lock()
+_history_memo: Dict[int, tuple] = {}
+
+
+def _cached_history(user_id: int) -> Optional[List[Dict[str, Any]]]:
+    with _history_lock:
+        entry = _history_memo.get(user_id)
+    if entry and time.monotonic() - entry[0] < _HISTORY_TTL:
+        return entry[1]
+    return None
+
+
+def _forget_history(user_id: Optional[int]) -> None:
+    """Drop ``user_id``'s cached history; other users' entries are untouched."""
+    with _history_lock:
+        _history_memo.pop(user_id, None)
+
+
+def _fetch_persisted_history(token: Optional[str]) -> List[Dict[str, Any]]:
+    # Runs on a worker thread, so the token is passed in rather than read from
+    # ``st.session_state``.
+    import requests
+
+    from app.frontend.api_client import API_BASE_URL
+
+    headers = {"Accept": "application/json"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    response = requests.get(f"{API_BASE_URL}/chat/history", headers=headers, timeout=15)
+    if response.status_code != 200:
+        raise RuntimeError(f"History request failed with status {response.status_code}")
+    history = response.json().get("history", [])
+    return history if isinstance(history, list) else []
+
+
+@lru_cache(maxsize=1)
+def _history_executor():
+    from concurrent.futures import ThreadPoolExecutor
+
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="chat-history")
+
+
+def _load_persisted_history(user_id: int, token: Optional[str]) -> List[Dict[str, Any]]:
+    """Worker-thread fetch; only successful lookups are cached."""
     try:
-        response = api_get("/chat/history")
-        if response.status_code == 200:
-            payload = response.json()
-            history = payload.get("history", [])
-            if isinstance(history, list):
-                return history
+        history = _fetch_persisted_history(token)
     except Exception:
-        pass
-    return []
+        return []
+    now = time.monotonic()
+    with _history_lock:
+        # Evict expired entries on write so the memo only holds live sessions.
+        for stale in [uid for uid, (stamp, _) in _history_memo.items() if now - stamp >= _HISTORY_TTL]:
+            del _history_memo[stale]
+        _history_memo[user_id] = (now, history)
+    return history
 
 
 def _ensure_chat_history_loaded() -> None:
+    """Start loading the saved conversation without blocking the first paint."""
+    import streamlit as st
+
     st.session_state.setdefault("chat_history", [])
     user_id = _current_user_id()
 
     if user_id is not None and not st.session_state.get("chat_history_loaded"):
-        st.session_state.chat_history = _load_persisted_history(user_id)
-        st.session_state.chat_history_loaded = True
+        cached = _cached_history(user_id)
+        if cached is not None:
+            st.session_state.chat_history = list(cached)
+            st.session_state.chat_history_loaded = True
+        elif "_history_future" not in st.session_state:
+            st.session_state["_history_future"] = _history_executor().submit(
+                _load_persisted_history, user_id, st.session_state.get("token")
+            )
     elif user_id is None and "chat_history_loaded" not in st.session_state:
         st.session_state.chat_history_loaded = True
 
 
+def _collect_chat_history() -> bool:
+    """Apply the background history fetch if it has finished.
+
+    Returns ``True`` while the fetch is still running; the page then renders a
+    placeholder and :func:`_finish_pending_history` reruns once it lands.
+    """
+    import streamlit as st
+
+    future = st.session_state.get("_history_future")
+    if future is None:
+        return False
+    if not future.done():
+        return True
+    st.session_state.chat_history = future.result()
+    st.session_state.chat_history_loaded = True
+    del st.session_state["_history_future"]
+    return False
+
+
+def _finish_pending_history() -> None:
+    """With the page already on screen, poll the history fetch and rerun.
+
+    Each pass sleeps only briefly so the script thread is never held for the
+    whole request; :func:`_collect_chat_history` applies the result once the
+    future reports done.
+    """
+    import streamlit as st
+
+    future = st.session_state.get("_history_future")
+    if future is None:
+        return
+    if not future.done():
+        time.sleep(_HISTORY_POLL_SECONDS)
+    st.experimental_rerun()
+
+
 def _record_interaction(message: str, response: str, history: Optional[List[Dict[str, Any]]] = None) -> None:
+    from datetime import datetime
+
+    import streamlit as st
+
     if history is not None:
         st.session_state.chat_history = history
         return
 
     timestamp = datetime.utcnow().isoformat()
-    st.session_state.chat_history.extend(
-        [
-            {"sender": "user", "message": message, "timestamp": timestamp},
-            {"sender": "assistant", "message": response, "timestamp": timestamp},
-        ]
+    entries = [
+        {"sender": "user", "message": message, "timestamp": timestamp},
+        {"sender": "assistant", "message": response, "timestamp": timestamp},
+    ]
+    st.session_state.chat_history.extend(entries)
+
+
+def _render_bubble(entry: Dict[str, Any]) -> str:
+    import html
+
+    sender = entry.get("sender")
+    message_text = entry.get("message") or entry.get("response") or ""
+    timestamp = entry.get("timestamp", "")
+    if sender == "user":
+        bubble_class = "chat-bubble chat-bubble--user"
+        label = "🙋 You"
+    else:
+        bubble_class = "chat-bubble chat-bubble--assistant"
+        label = "🤖 Assistant"
+
+    return (
+        f"<div class='{bubble_class}'><strong>{label} • {timestamp}</strong>"
+        f"<div>{html.escape(message_text)}</div></div>"
     )
 
 
-def _export_history_text() -> str:
+def _history_markup(history: List[Dict[str, Any]]) -> List[str]:
+    """Return bubble markup for each entry, reusing markup from the last run.
+
+    The memo is rebuilt from ``history`` every time, so messages that are no
+    longer in the conversation are dropped with it.
+    """
+    import streamlit as st
+
+    previous: Dict[tuple, str] = st.session_state.get("_chat_rendered", {})
+    rendered: Dict[tuple, str] = {}
+    markup = []
+    for entry in history:
+        entry_id = (
+            str(entry.get("timestamp", "")),
+            entry.get("sender"),
+            entry.get("message") or entry.get("response") or "",
+        )
+        bubble = rendered.get(entry_id) or previous.get(entry_id) or _render_bubble(entry)
+        rendered[entry_id] = bubble
+        markup.append(bubble)
+    st.session_state["_chat_rendered"] = rendered
+    return markup
+
+
+def _export_history_text() -> bytes:
+    import io
+
+    import streamlit as st
+
     if not st.session_state.get("chat_history"):
-        return "No saved history."
+        return b"No saved history."
 
-    lines = ["Smart Assistant Conversation Log", ""]
+    buffer = io.BytesIO()
+    buffer.write(b"Smart Assistant Conversation Log\n\n")
     for item in st.session_state.chat_history:
         timestamp = item.get("timestamp", "--")
         message = item.get("message", "")
         response = item.get("response", "")
-        lines.append(f"[{timestamp}] You: {message}")
-        lines.append(f"[{timestamp}] Assistant: {response}")
-        lines.append("")
-    return "\n".join(lines)
+        buffer.write(f"[{timestamp}] You: {message}\n".encode("utf-8"))
+        buffer.write(f"[{timestamp}] Assistant: {response}\n\n".encode("utf-8"))
+    return buffer.getvalue()
+
+
+def _export_history_json(history: List[Dict[str, Any]]) -> bytes:
+    """Serialise ``history`` for download, reusing the bytes until it changes."""
+    import json
+
+    import streamlit as st
+
+    signature = (len(history), str(history[-1].get("timestamp", "")) if history else "")
+    cached = st.session_state.get("_chat_export")
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    payload = json.dumps(history, ensure_ascii=False).encode("utf-8")
+    st.session_state["_chat_export"] = (signature, payload)
+    return payload
 
 
 def show_chat_assistant() -> None:
     """Render the chat assistant interface with persistent history."""
+    import streamlit as st
 
-    st.markdown(
-        """
-        <style>
-        .chat-bubble {
-            border-radius: 16px;
-            padding: 1rem 1.2rem;
-            margin-bottom: 0.7rem;
-            border: 1px solid rgba(148, 163, 184, 0.18);
-            background: rgba(15, 23, 42, 0.62);
-            box-shadow: 0 18px 44px rgba(8, 47, 73, 0.24);
-            color: #e2e8f0;
-            backdrop-filter: blur(16px);
-        }
-        .chat-bubble strong {
-            display: block;
-            font-size: 0.78rem;
-            letter-spacing: 0.12em;
-            text-transform: uppercase;
-            color: #cbd5f5;
-            margin-bottom: 0.35rem;
-        }
-        .chat-bubble--user {
-            background: linear-gradient(135deg, rgba(56,189,248,0.26), rgba(14,165,233,0.16));
-            border-color: rgba(56, 189, 248, 0.4);
-        }
-        .chat-bubble--assistant {
-            background: linear-gradient(135deg, rgba(34,197,94,0.3), rgba(22,163,74,0.16));
-            border-color: rgba(34, 197, 94, 0.4);
-        }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    from app.frontend.api_client import api_delete, api_post
+    from app.frontend.components._css import CHAT_CSS, inject_css
+
+    inject_css(CHAT_CSS)
 
     st.header("💬 Smart City Chat Assistant")
     st.caption(
@@ -127,6 +294,7 @@ def show_chat_assistant() -> None:
     )
 
     send_clicked = st.button("Send 🚀", type="primary")
+    history_pending = _collect_chat_history()
 
     if send_clicked and user_message.strip():
         payload: Dict[str, Any] = {"message": user_message}
@@ -140,6 +308,10 @@ def show_chat_assistant() -> None:
                     assistant_reply = data.get("response", "") if isinstance(data, dict) else ""
                     parsed_history = history if isinstance(history, list) else None
                     _record_interaction(user_message, assistant_reply, parsed_history)
+                    # The reply carries the fresh history; a pending load is stale.
+                    st.session_state.pop("_history_future", None)
+                    st.session_state.chat_history_loaded = True
+                    _forget_history(user_id)
                     st.session_state["_pending_clear_chat_input"] = True
                     st.experimental_rerun()
                 else:
@@ -147,58 +319,37 @@ def show_chat_assistant() -> None:
             except Exception as exc:  # pragma: no cover - defensive
                 st.error(f"Unexpected error: {exc}")
 
+    # The input is on screen; overlap remaining cold imports with reading time.
+    _start_background_preload()
+
     history = st.session_state.get("chat_history", [])
 
     st.divider()
 
     if not history:
         st.subheader("Latest response")
-        st.info("No saved conversations yet. Start chatting to build your history.")
+        if history_pending:
+            st.info("Loading your saved conversation...")
+            _finish_pending_history()
+        else:
+            st.info("No saved conversations yet. Start chatting to build your history.")
         return
 
+    markup = _history_markup(history)
     latest_exchange = history[-2:] if len(history) >= 2 else history
     latest_timestamp = latest_exchange[-1].get("timestamp", "")
 
     st.subheader("Latest response")
     st.caption(f"Last updated: {latest_timestamp or 'recently'}")
 
-    for entry in latest_exchange:
-        sender = entry.get("sender")
-        message_text = entry.get("message") or entry.get("response") or ""
-        timestamp = entry.get("timestamp", "")
-        if sender == "user":
-            bubble_class = "chat-bubble chat-bubble--user"
-            label = "🙋 You"
-        else:
-            bubble_class = "chat-bubble chat-bubble--assistant"
-            label = "🤖 Assistant"
-
-        st.markdown(
-            f"<div class='{bubble_class}'><strong>{label} • {timestamp}</strong><div>{html.escape(message_text)}</div></div>",
-            unsafe_allow_html=True,
-        )
+    st.markdown("\n".join(markup[-len(latest_exchange):]), unsafe_allow_html=True)
 
     with st.expander("Conversation history", expanded=False):
-        for entry in history:
-            sender = entry.get("sender")
-            message_text = entry.get("message") or entry.get("response") or ""
-            timestamp = entry.get("timestamp", "")
-            if sender == "user":
-                bubble_class = "chat-bubble chat-bubble--user"
-                label = "🙋 You"
-            else:
-                bubble_class = "chat-bubble chat-bubble--assistant"
-                label = "🤖 Assistant"
-
-            st.markdown(
-                f"<div class='{bubble_class}'><strong>{label} • {timestamp}</strong><div>{html.escape(message_text)}</div></div>",
-                unsafe_allow_html=True,
-            )
+        st.markdown("\n".join(markup), unsafe_allow_html=True)
 
-        export_payload = json.dumps(history, ensure_ascii=False, indent=2)
         st.download_button(
             "Download history",
-            export_payload,
+            _export_history_json(history),
             file_name="smart_assistant_history.json",
             mime="application/json",
             use_container_width=True,
@@ -206,7 +357,9 @@ def show_chat_assistant() -> None:
 
         if st.button("Delete history 🗑️", use_container_width=True):
             st.session_state.chat_history = []
+            st.session_state["_chat_rendered"] = {}
             st.session_state["_pending_clear_chat_input"] = True
+            _forget_history(user_id)
             if user_id is not None:
                 try:
                     response = api_delete("/chat/history")
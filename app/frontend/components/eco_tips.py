@@ -5,12 +5,19 @@ from __future__ import annotations
 
 import html
 import os
+import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterator, Tuple
 
 import requests
 import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 # Add project root to path once for local execution
@@ -21,45 +28,188 @@ if PROJECT_ROOT not in sys.path:
 from app.core.config import settings
 
 
-API_BASE_URL = f"http://{settings.api_host}:{settings.api_port}"
+@lru_cache(maxsize=1)
+def _base_url() -> str:
+    """Backend origin, formatted once from settings on first use."""
+    return f"http://{settings.api_host}:{settings.api_port}"
+
+# One pooled session per process keeps the connection to the API alive across
+# reruns. Retry only covers idempotent methods, so POSTs are never replayed.
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_maxsize=16, max_retries=Retry(total=2, backoff_factor=0.2)))
+
+_CATEGORIES: Tuple[str, ...] = (
+    "Energy Conservation",
+    "Water Saving",
+    "Waste Reduction",
+    "Sustainable Transport",
+    "Green Living",
+    "Renewable Energy",
+    "Air Quality Improvement",
+    "Climate Action",
+)
+
+_FALLBACK_TIPS = MappingProxyType({
+    "Energy Conservation": "💡 Switch to LED bulbs - they use 75% less energy and last 25 times longer than incandescent bulbs!",
+    "Water Saving": "💧 Fix leaky faucets promptly - a single drip per second can waste over 3,000 gallons per year!",
+    "Waste Reduction": "♻️ Start composting kitchen scraps - it reduces waste by 30% and creates nutrient-rich soil!",
+    "Sustainable Transport": "🚲 Try bike commuting once a week - it reduces carbon emissions and improves your health!",
+    "Green Living": "🌿 Add indoor plants to your home - they purify air and reduce stress levels naturally!",
+    "Renewable Energy": "☀️ Consider solar panels - they can reduce electricity bills by 70-90% over their lifetime!",
+    "Air Quality": "🌬️ Use natural air fresheners like baking soda and essential oils instead of chemical sprays!",
+    "Climate Action": "🌍 Reduce meat consumption by one day per week - it can save 1,900 lbs of CO2 annually!"
+})
+_DEFAULT_FALLBACK_TIP = "🌱 Start small - every eco-friendly action counts towards a sustainable future!"
+
+# Lowercase keywords that map free-text topics onto a fallback category.
+_FALLBACK_KEYWORDS = {
+    "Energy Conservation": ("energy", "electric", "led", "bulb", "insulation", "heating"),
+    "Water Saving": ("water", "shower", "faucet", "leak", "rain"),
+    "Waste Reduction": ("waste", "recycl", "compost", "plastic", "trash"),
+    "Sustainable Transport": ("transport", "bike", "bicycl", "commut", "car", "bus", "transit"),
+    "Green Living": ("green", "plant", "garden", "indoor"),
+    "Renewable Energy": ("renewable", "solar", "wind", "panel"),
+    "Air Quality": ("air", "pollution", "smog"),
+    "Climate Action": ("climate", "carbon", "co2", "emission", "meat", "diet"),
+}
+_FALLBACK_INDEX: Tuple[Tuple[str, str], ...] = tuple(
+    (keyword, _FALLBACK_TIPS[category])
+    for category, keywords in _FALLBACK_KEYWORDS.items()
+    for keyword in keywords
+)
+
+_SIDEBAR_FEATURES_MD = """
+    • **AI-Powered Advice**: Get personalized sustainability tips
+    • **Multiple Categories**: Energy, water, waste, transport & more
+    • **Custom Topics**: Ask about any eco-friendly topic
+    • **Save & Review**: Keep track of your favorite tips
+    • **Quick Access**: Instant tips for popular topics
+    """
+
+_FACTS: Tuple[str, ...] = (
+    "🌍 Recycling one aluminum can saves enough energy to power a TV for 3 hours",
+    "💧 A 5-minute shower uses 25 gallons of water",
+    "🚗 Walking or biking for 2 miles prevents 2 lbs of CO2 emissions",
+    "🌱 One tree produces enough oxygen for 2 people per day"
+)
+
+# Every line break style maps to a single <br>; a blank line therefore becomes
+# <br><br>, matching the old chain of replace() calls in one scan.
+_NEWLINE_RE = re.compile(r"\r\n?|\n")
+
+_TIP_CARD_TMPL = """
+        <div style='
+            background: linear-gradient(135deg, #e8f5e8 0%, #f0f8f0 100%);
+            border-left: 5px solid #2E8B57;
+            border-radius: 12px;
+            padding: 2rem;
+            margin: 1.5rem 0;
+            box-shadow: 0 18px 40px rgba(46, 139, 87, 0.22);
+        '>
+            <h4 style='color: #2E8B57; margin-bottom: 1.25rem; display: flex; align-items: center; font-size: 1.6rem;'>
+                🌱 Eco Tip for "{safe_topic}"
+            </h4>
+            <p style='color: #334155; line-height: 1.8; font-size: 1.2rem; margin-bottom: 0;'>
+                {formatted_tip}
+            </p>
+        </div>
+        """
+
+_SAVED_TIP_TMPL = """
+                <div style='
+                    background: #f8f9fa;
+                    border-radius: 8px;
+                    padding: 1rem;
+                    margin: 0.5rem 0;
+                    border-left: 3px solid #28a745;
+                '>
+                    <strong style='color: #28a745;'>🏷️ {topic}</strong><br>
+                    <span style='color: #666; font-size: 0.9rem;'>{timestamp}</span><br>
+                    <p style='margin: 0.5rem 0 0 0; color: #444;'>{preview}...</p>
+                </div>
+                """
+
+
+# Seconds a generated tip is reused for repeat requests on the same topic.
+_TIP_TTL = 600
+
+
+def _fetch_tip_uncached(endpoint: str, params: Dict, timeout: int = 20) -> Dict:
+    """GET ``endpoint`` on the pooled session; raises on HTTP errors.
+
+    Touches no Streamlit state, so it is the entry point for worker threads.
+    """
+    response = _SESSION.get(f"{_base_url()}{endpoint}", params=params, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+
+@st.cache_data(ttl=_TIP_TTL, show_spinner=False)
+def _cached_get(endpoint: str, params_tuple: tuple, timeout: int = 20) -> Dict:
+    """Memoised :func:`_fetch_tip_uncached`; failures raise and are not cached.
+
+    Script thread only: ``st.cache_data`` needs the run context.
+    """
+    return _fetch_tip_uncached(endpoint, dict(params_tuple), timeout)
 
 
 class APIHelper:
     """Thin wrapper around requests for eco tip API calls."""
 
     @staticmethod
-    def make_api_request(endpoint: str, method: str = "GET", data: Dict | None = None, timeout: int = 20):
-        url = f"{API_BASE_URL}{endpoint}"
+    def make_api_request(
+        endpoint: str,
+        method: str = "GET",
+        data: Dict | None = None,
+        timeout: int = 20,
+        use_cache: bool = True,
+    ):
+        url = f"{_base_url()}{endpoint}"
         payload = data or {}
         try:
             if method.upper() == "POST":
-                response = requests.post(url, json=payload, timeout=timeout)
+                response = _SESSION.post(url, json=payload, timeout=timeout)
+            elif use_cache:
+                # GETs are idempotent, so repeat clicks on a topic reuse the memo.
+                return _cached_get(endpoint, tuple(sorted(payload.items())), timeout)
             else:
-                response = requests.get(url, params=payload, timeout=timeout)
+                response = _SESSION.get(url, params=payload, timeout=timeout)
 
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as exc:
             return {"error": str(exc)}
 
+    @staticmethod
+    def stream_api_request(endpoint: str, data: Dict | None = None, timeout: int = 60) -> Iterator[str]:
+        """Yield decoded text chunks from a streaming GET endpoint as they arrive."""
+        with _SESSION.get(f"{_base_url()}{endpoint}", params=data or {}, stream=True, timeout=timeout) as response:
+            response.raise_for_status()
+            response.encoding = "utf-8"
+            for chunk in response.iter_content(chunk_size=None, decode_unicode=True):
+                if chunk:
+                    yield chunk
+
+    @staticmethod
+    def batch_generate(topics, timeout: int = 60) -> Dict[str, str]:
+        """Generate tips for several topics with a single POST; returns ``{topic: tip}``."""
+        response = APIHelper.make_api_request(
+            "/api/eco-tips/generate-batch", "POST", {"topics": list(topics)}, timeout=timeout
+        )
+        if not isinstance(response, dict) or response.get("status") != "success":
+            return {}
+        tips = response.get("tips")
+        return tips if isinstance(tips, dict) else {}
+
 
 class ConfigHelper:
     """Static configuration helpers for eco tip UI."""
 
-    _DEFAULT_ECO_CATEGORIES = [
-        "Energy Conservation",
-        "Water Saving",
-        "Waste Reduction",
-        "Sustainable Transport",
-        "Green Living",
-        "Renewable Energy",
-        "Air Quality Improvement",
-        "Climate Action",
-    ]
+    _DEFAULT_ECO_CATEGORIES = _CATEGORIES
 
     @classmethod
     def get_eco_tip_categories(cls):
-        return cls._DEFAULT_ECO_CATEGORIES.copy()
+        return _CATEGORIES
 
 
 class TextProcessor:
@@ -70,11 +220,7 @@ class TextProcessor:
         if not raw_text:
             return "No tip available right now."
 
-        escaped = html.escape(raw_text)
-        formatted = escaped.replace("\r\n", "\n").replace("\r", "\n")
-        formatted = formatted.replace("\n\n", "<br><br>")
-        formatted = formatted.replace("\n", "<br>")
-        return formatted
+        return _NEWLINE_RE.sub("<br>", html.escape(raw_text))
 
 
 def get_current_timestamp() -> str:
@@ -138,8 +284,51 @@ def render_eco_tips():
         # Display saved tips
         display_saved_tips()
 
-def generate_eco_tip(topic: str):
+def _stream_eco_tip(topic: str) -> str:
+    """Render the tip card progressively as text streams in; returns the full tip."""
+    placeholder = st.empty()
+    safe_topic = html.escape(topic)
+    parts = []
+    try:
+        for chunk in APIHelper.stream_api_request("/api/eco-tips/generate-stream", {"topic": topic}):
+            parts.append(chunk)
+            placeholder.markdown(
+                _TIP_CARD_TMPL.format(
+                    safe_topic=safe_topic,
+                    formatted_tip=TextProcessor.format_response_text("".join(parts)),
+                ),
+                unsafe_allow_html=True,
+            )
+    except requests.exceptions.RequestException:
+        parts = []
+    placeholder.empty()
+    return "".join(parts).strip()
+
+def _remembered_tip(topic: str) -> str | None:
+    """Return the tip streamed for ``topic`` within the last ``_TIP_TTL`` seconds."""
+    entry = st.session_state.get("_streamed_tips", {}).get(topic)
+    if entry and time.monotonic() - entry[0] < _TIP_TTL:
+        return entry[1]
+    return None
+
+def _remember_tip(topic: str, tip: str) -> None:
+    memo = st.session_state.setdefault("_streamed_tips", {})
+    memo[topic] = (time.monotonic(), tip)
+
+def generate_eco_tip(topic: str, fresh: bool = False):
     """Generate and display eco tip for given topic"""
+    # Repeat clicks reuse the finished tip; only "Generate Another" asks anew.
+    remembered = None if fresh else _remembered_tip(topic)
+    if remembered:
+        display_eco_tip({"status": "success", "tips": remembered}, topic)
+        return
+
+    streamed_tip = _stream_eco_tip(topic)
+    if streamed_tip:
+        _remember_tip(topic, streamed_tip)
+        display_eco_tip({"status": "success", "tips": streamed_tip}, topic)
+        return
+
     with st.spinner(f"Generating eco tip for '{topic}'..."):
         try:
             # Make API request
@@ -147,6 +336,7 @@ def generate_eco_tip(topic: str):
                 endpoint="/api/eco-tips/generate",
                 method="GET",
                 data={"topic": topic},
+                use_cache=not fresh,
             )
 
             
@@ -167,7 +357,25 @@ def generate_eco_tip(topic: str):
             st.info("💡 Here's a general tip while we fix the connection:")
             display_fallback_tip(topic)
 
-def display_eco_tip(response: Dict, topic: str):
+def _fetch_many(topics) -> Dict[str, Dict]:
+    """Request tips for several topics concurrently and return them keyed by topic.
+
+    Workers call the uncached fetch; ``st.cache_data`` is script-thread only.
+    """
+    results: Dict[str, Dict] = {}
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        futures = {
+            executor.submit(_fetch_tip_uncached, "/api/eco-tips/generate", {"topic": topic}): topic
+            for topic in topics
+        }
+        for future in as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except Exception as exc:
+                results[futures[future]] = {"error": str(exc)}
+    return results
+
+def display_eco_tip(response: Dict, topic: str, key: str = "regenerate_current"):
     """Display the generated eco tip in a styled container"""
     if not isinstance(response, dict):
         response = {}
@@ -182,45 +390,22 @@ def display_eco_tip(response: Dict, topic: str):
     
     # Create styled container
     st.markdown(
-        f"""
-        <div style='
-            background: linear-gradient(135deg, #e8f5e8 0%, #f0f8f0 100%);
-            border-left: 5px solid #2E8B57;
-            border-radius: 12px;
-            padding: 2rem;
-            margin: 1.5rem 0;
-            box-shadow: 0 18px 40px rgba(46, 139, 87, 0.22);
-        '>
-            <h4 style='color: #2E8B57; margin-bottom: 1.25rem; display: flex; align-items: center; font-size: 1.6rem;'>
-                🌱 Eco Tip for "{safe_topic}"
-            </h4>
-            <p style='color: #334155; line-height: 1.8; font-size: 1.2rem; margin-bottom: 0;'>
-                {formatted_tip}
-            </p>
-        </div>
-        """,
+        _TIP_CARD_TMPL.format(safe_topic=safe_topic, formatted_tip=formatted_tip),
         unsafe_allow_html=True,
     )
     
     # Action buttons
-    if st.button("🔄 Generate Another", key=f"regenerate_{topic}"):
-        generate_eco_tip(topic)
+    # A fixed key (rather than one per topic) keeps the widget registry bounded.
+    if st.button("🔄 Generate Another", key=key):
+        generate_eco_tip(topic, fresh=True)
 
 def display_fallback_tip(topic: str):
     """Display fallback tip when API is unavailable"""
-    fallback_tips = {
-        "Energy Conservation": "💡 Switch to LED bulbs - they use 75% less energy and last 25 times longer than incandescent bulbs!",
-        "Water Saving": "💧 Fix leaky faucets promptly - a single drip per second can waste over 3,000 gallons per year!",
-        "Waste Reduction": "♻️ Start composting kitchen scraps - it reduces waste by 30% and creates nutrient-rich soil!",
-        "Sustainable Transport": "🚲 Try bike commuting once a week - it reduces carbon emissions and improves your health!",
-        "Green Living": "🌿 Add indoor plants to your home - they purify air and reduce stress levels naturally!",
-        "Renewable Energy": "☀️ Consider solar panels - they can reduce electricity bills by 70-90% over their lifetime!",
-        "Air Quality": "🌬️ Use natural air fresheners like baking soda and essential oils instead of chemical sprays!",
-        "Climate Action": "🌍 Reduce meat consumption by one day per week - it can save 1,900 lbs of CO2 annually!"
-    }
-    
-    # Find the best matching tip
-    tip = fallback_tips.get(topic, "🌱 Start small - every eco-friendly action counts towards a sustainable future!")
+    # Find the best matching tip: exact category first, then a keyword in the topic
+    tip = _FALLBACK_TIPS.get(topic)
+    if tip is None:
+        lowered = topic.lower()
+        tip = next((candidate for keyword, candidate in _FALLBACK_INDEX if keyword in lowered), _DEFAULT_FALLBACK_TIP)
     
     st.info(tip)
 
@@ -232,15 +417,25 @@ def save_tip_to_session(response: Dict, topic: str):
     if not isinstance(response, dict):
         response = {}
 
+    tip = str((response.get('tips') or response.get('tip') or response.get('response', '') or '')).strip()
+    # Escape once here so the saved tips expander only splices strings on rerun;
+    # the raw fields are kept for export and analytics.
     tip_data = {
         'topic': topic,
-        'tip': str((response.get('tips') or response.get('tip') or response.get('response', '') or '')).strip(),
+        'tip': tip,
+        'topic_safe': html.escape(topic),
+        'preview_safe': html.escape(tip[:150]),
         'timestamp': get_current_timestamp(),
     }
     
     # Add to beginning of list and limit to 10 tips
     st.session_state.saved_tips.insert(0, tip_data)
     st.session_state.saved_tips = st.session_state.saved_tips[:10]
+    _bump_saved_tips_rev()
+
+def _bump_saved_tips_rev():
+    """Mark saved_tips as changed so memoised views recompute."""
+    st.session_state['saved_tips_rev'] = st.session_state.get('saved_tips_rev', 0) + 1
 
 def display_saved_tips():
     """Display previously saved tips"""
@@ -248,25 +443,21 @@ def display_saved_tips():
         st.markdown("### 📚 Your Recent Tips")
         
         with st.expander(f"View {len(st.session_state.saved_tips)} Saved Tips"):
-            for tip_data in st.session_state.saved_tips:
-                tip_preview = str(tip_data.get('tip', '')).strip()
-                st.markdown(f"""
-                <div style='
-                    background: #f8f9fa;
-                    border-radius: 8px;
-                    padding: 1rem;
-                    margin: 0.5rem 0;
-                    border-left: 3px solid #28a745;
-                '>
-                    <strong style='color: #28a745;'>🏷️ {tip_data['topic']}</strong><br>
-                    <span style='color: #666; font-size: 0.9rem;'>{tip_data.get('timestamp', 'Recent')}</span><br>
-                    <p style='margin: 0.5rem 0 0 0; color: #444;'>{tip_preview[:150]}...</p>
-                </div>
-                """, unsafe_allow_html=True)
+            html_parts = [
+                _SAVED_TIP_TMPL.format(
+                    # Tips saved before the *_safe fields existed are escaped here.
+                    topic=tip_data.get('topic_safe') or html.escape(str(tip_data.get('topic', ''))),
+                    timestamp=tip_data.get('timestamp', 'Recent'),
+                    preview=tip_data.get('preview_safe') or html.escape(str(tip_data.get('tip', ''))[:150]),
+                )
+                for tip_data in st.session_state.saved_tips
+            ]
+            st.markdown("".join(html_parts), unsafe_allow_html=True)
             
             # Clear saved tips button
             if st.button("🗑️ Clear All Saved Tips"):
                 st.session_state.saved_tips = []
+                _bump_saved_tips_rev()
                 st.success("All saved tips cleared!")
                 st.rerun()
 
@@ -287,33 +478,38 @@ def quick_tips_section():
     cols = st.columns(3)
     for i, (icon, label, topic) in enumerate(quick_topics):
         with cols[i % 3]:
-            if st.button(f"{icon} {label}", key=f"quick_{topic}", use_container_width=True):
+            if st.button(f"{icon} {label}", key=f"quick_{i}", use_container_width=True):
                 generate_eco_tip(topic)
 
+    if st.button("🔄 Refresh all", key="quick_refresh_all", use_container_width=True):
+        topics = [topic for _icon, _label, topic in quick_topics]
+        with st.spinner("Generating tips for all popular topics..."):
+            results = {topic: {"status": "success", "tips": tip} for topic, tip in APIHelper.batch_generate(topics).items()}
+            missing = [topic for topic in topics if topic not in results]
+            if missing:
+                # Backends without the batch route fall back to parallel GETs.
+                results.update(_fetch_many(missing))
+
+        for i, (_icon, _label, topic) in enumerate(quick_topics):
+            response = results.get(topic) or {}
+            if response.get("status") != "success":
+                error_message = response.get("detail") or response.get("error", "Unknown error")
+                st.error(f"Error generating tip for '{topic}': {error_message}")
+            else:
+                display_eco_tip(response, topic, key=f"regenerate_quick_{i}")
+
 def render_eco_tips_sidebar():
     """Render eco tips information in sidebar"""
     st.sidebar.markdown("---")
     st.sidebar.markdown("### 🌱 Eco Tips Features")
-    st.sidebar.markdown("""
-    • **AI-Powered Advice**: Get personalized sustainability tips
-    • **Multiple Categories**: Energy, water, waste, transport & more
-    • **Custom Topics**: Ask about any eco-friendly topic
-    • **Save & Review**: Keep track of your favorite tips
-    • **Quick Access**: Instant tips for popular topics
-    """)
+    st.sidebar.markdown(_SIDEBAR_FEATURES_MD)
     
-    # Add sustainability facts
+    # Add sustainability facts; pick once per session so reruns don't re-roll it
     st.sidebar.markdown("### 📊 Did You Know?")
-    facts = [
-        "🌍 Recycling one aluminum can saves enough energy to power a TV for 3 hours",
-        "💧 A 5-minute shower uses 25 gallons of water",
-        "🚗 Walking or biking for 2 miles prevents 2 lbs of CO2 emissions",
-        "🌱 One tree produces enough oxygen for 2 people per day"
-    ]
-    
-    import random
-    daily_fact = random.choice(facts)
-    st.sidebar.info(daily_fact)
+    if 'daily_fact' not in st.session_state:
+        import random
+        st.session_state.daily_fact = random.choice(_FACTS)
+    st.sidebar.info(st.session_state.daily_fact)
 
 # Additional utility functions for eco tips
 def get_eco_tip_analytics():
@@ -321,32 +517,42 @@ def get_eco_tip_analytics():
     if 'saved_tips' not in st.session_state:
         return {}
     
+    # Reuse the last result until saved_tips is mutated again.
+    rev = st.session_state.get('saved_tips_rev', 0)
+    memo = st.session_state.get('_eco_tip_analytics')
+    if memo is not None and memo[0] == rev:
+        return memo[1]
+
     tips = st.session_state.saved_tips
     topics = [tip['topic'] for tip in tips]
     
     from collections import Counter
     topic_counts = Counter(topics)
     
-    return {
+    analytics = {
         'total_tips': len(tips),
-        'unique_topics': len(set(topics)),
+        'unique_topics': len(topic_counts),
         'most_popular_topic': topic_counts.most_common(1)[0] if topic_counts else None
     }
+    st.session_state['_eco_tip_analytics'] = (rev, analytics)
+    return analytics
 
 def export_saved_tips():
     """Export saved tips to text format"""
     if 'saved_tips' not in st.session_state or not st.session_state.saved_tips:
         return "No saved tips to export."
     
-    export_text = "# My Eco Tips Collection\n\n"
+    parts = ["# My Eco Tips Collection\n\n"]
     
     for i, tip_data in enumerate(st.session_state.saved_tips, 1):
-        export_text += f"## {i}. {tip_data['topic']}\n"
-        export_text += f"**Date:** {tip_data.get('timestamp', 'Recent')}\n\n"
-        export_text += f"{tip_data['tip']}\n\n"
-        export_text += "---\n\n"
+        parts.append(
+            f"## {i}. {tip_data['topic']}\n"
+            f"**Date:** {tip_data.get('timestamp', 'Recent')}\n\n"
+            f"{tip_data['tip']}\n\n"
+            "---\n\n"
+        )
     
-    return export_text
+    return "".join(parts)
 
 # Main function to run the component
 if __name__ == "__main__":
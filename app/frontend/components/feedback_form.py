@@ -1,22 +1,42 @@
 """Role-aware feedback experience for citizens and authorities."""
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, cast
+from typing import TYPE_CHECKING, Dict, List, Optional, cast
 
 import html
 
-import pandas as pd
 import streamlit as st
 
 from app.frontend.api_client import api_get, api_patch, api_post
 
+if TYPE_CHECKING:
+    # pandas is only needed for the citizen table, so it is imported on first use.
+    import pandas as pd
+
 STATUS_ORDER = ["reported", "in_process", "solved"]
 STATUS_LABELS = {
     "reported": "Reported",
     "in_process": "In Process",
     "solved": "Solved",
 }
+_STATUS_INDEX = {key: index for index, key in enumerate(STATUS_ORDER)}
+_STATUS_LABEL_OPTIONS = tuple(STATUS_LABELS[key] for key in STATUS_ORDER)
+_STATUS_INVERSE = {value: key for key, value in STATUS_LABELS.items()}
+_FILTER_OPTIONS = ("All", *_STATUS_LABEL_OPTIONS)
+FEEDBACK_CATEGORIES: List[str] = [
+    "Environmental Issues",
+    "Public Transportation",
+    "Waste Management",
+    "Water Quality",
+    "Energy Efficiency",
+    "Urban Planning",
+    "Public Health",
+    "Education",
+    "Economic Development",
+    "Other",
+]
 AUTHORITY_OPTIONS: List[str] = [
     "Mayor's Office",
     "City Council",
@@ -27,6 +47,9 @@ AUTHORITY_OPTIONS: List[str] = [
     "Housing & Urban Development",
 ]
 
+# Background pool for overlapping API reads with widget construction.
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="feedback")
+
 
 def _label_for_status(value: Optional[str]) -> str:
     if not value:
@@ -67,15 +90,20 @@ def render_feedback_header(user_type: str) -> None:
 
 def render_feedback_section() -> None:
     user_type = st.session_state.get("user_type", "user") or "user"
+    # Start fetching the citizen's submissions while the header and form render.
+    # Worker threads cannot read st.session_state, so the token is captured here.
+    token = st.session_state.get("token")
+    prefetch = None if user_type == "authority" else _EXECUTOR.submit(_load_my_feedback, token)
     render_feedback_header(user_type)
 
     if user_type == "authority":
         render_authority_console()
     else:
-        render_citizen_console()
+        render_citizen_console(prefetch)
 
 
-def render_citizen_console() -> None:
+def render_citizen_console(prefetch: Optional[Future] = None) -> None:
+    submitted_new = False
     with st.container():
         st.markdown(
             "<div class='glass-panel'>",
@@ -88,21 +116,7 @@ def render_citizen_console() -> None:
 
         with st.form("citizen_feedback_form", clear_on_submit=True):
             col_primary = st.columns(2)
-            category = col_primary[0].selectbox(
-                "Category",
-                [
-                    "Environmental Issues",
-                    "Public Transportation",
-                    "Waste Management",
-                    "Water Quality",
-                    "Energy Efficiency",
-                    "Urban Planning",
-                    "Public Health",
-                    "Education",
-                    "Economic Development",
-                    "Other",
-                ],
-            )
+            category = col_primary[0].selectbox("Category", FEEDBACK_CATEGORIES)
             priority = col_primary[1].select_slider(
                 "Priority",
                 options=["Low", "Medium", "High", "Critical"],
@@ -129,6 +143,7 @@ def render_citizen_console() -> None:
                     }
                     response = api_post("/feedback/submit", json=payload)
                     if response.status_code == 201:
+                        submitted_new = True
                         st.success("Thank you! Your feedback has been recorded.")
                     else:
                         st.error(_extract_error(response))
@@ -144,7 +159,14 @@ def render_citizen_console() -> None:
             "<h3 style='margin-top:0;'>Your submissions</h3>",
             unsafe_allow_html=True,
         )
-        entries = _load_my_feedback()
+        if prefetch is None or submitted_new:
+            # The prefetch predates a new submission, so fetch a fresh list.
+            entries = _load_my_feedback(st.session_state.get("token"))
+        else:
+            try:
+                entries = prefetch.result(timeout=20)
+            except Exception:
+                entries = []
         if not entries:
             st.info("No feedback submitted yet. Use the form above to share your first report.")
             st.markdown("</div>", unsafe_allow_html=True)
@@ -165,12 +187,10 @@ def render_authority_console() -> None:
             unsafe_allow_html=True,
         )
         filter_col, hint_col = st.columns([1, 2])
-        statuses = ["All"] + [STATUS_LABELS[key] for key in STATUS_ORDER]
-        selection = cast(str, filter_col.selectbox("Filter by status", statuses))
+        selection = cast(str, filter_col.selectbox("Filter by status", _FILTER_OPTIONS))
         status_query: Optional[str] = None
         if selection and selection != "All":
-            inverse = {value: key for key, value in STATUS_LABELS.items()}
-            status_query = inverse.get(selection)
+            status_query = _STATUS_INVERSE.get(selection)
         route_label = (st.session_state.get("user_data", {}) or {}).get("feedback_route")
         if route_label:
             hint_col.caption(
@@ -188,8 +208,6 @@ def render_authority_console() -> None:
         st.info("No feedback matches the selected filter.")
         return
 
-    status_map = {v: k for k, v in STATUS_LABELS.items()}
-
     for record in entries:
         status_display = _label_for_status(record.get("status"))
         with st.expander(
@@ -212,15 +230,15 @@ def render_authority_console() -> None:
                     str,
                     col_upd[0].selectbox(
                         "Status",
-                        [STATUS_LABELS[key] for key in STATUS_ORDER],
-                        index=STATUS_ORDER.index(current_status) if current_status in STATUS_ORDER else 0,
+                        _STATUS_LABEL_OPTIONS,
+                        index=_STATUS_INDEX.get(current_status, 0),
                     ),
                 )
                 notes = col_upd[1].text_area("Authority notes", value=current_notes or "", height=80)
                 submitted = st.form_submit_button("Update status", use_container_width=True)
 
                 if submitted:
-                    status_value = status_map.get(new_status_label, current_status)
+                    status_value = _STATUS_INVERSE.get(new_status_label, current_status)
                     payload = {"status": status_value, "authority_notes": notes or None}
                     response = api_patch(f"/feedback/{record['id']}", json=payload)
                     if response.status_code == 200:
@@ -230,9 +248,10 @@ def render_authority_console() -> None:
                         st.error(_extract_error(response))
 
 
-def _load_my_feedback() -> List[Dict[str, Optional[str]]]:
+def _load_my_feedback(token: Optional[str]) -> List[Dict[str, Optional[str]]]:
+    # May run on a worker thread, so the caller passes the token explicitly.
     try:
-        response = api_get("/feedback/my")
+        response = api_get("/feedback/my", token=token)
         if response.ok:
             return response.json()
     except Exception:
@@ -252,22 +271,46 @@ def _load_manage_feedback(status_filter: Optional[str]) -> List[Dict[str, Option
 
 
 def _format_feedback_table(entries: List[Dict[str, Optional[str]]]) -> pd.DataFrame:
-    rows = []
+    import pandas as pd
+
+    # Build one list per column in a single pass; a dict of columns skips the
+    # per-row dict-to-block conversion pandas does for a list of records.
+    categories: List[Optional[str]] = []
+    priorities: List[str] = []
+    statuses: List[str] = []
+    authorities: List[str] = []
+    updated: List[Optional[str]] = []
+    submitted: List[Optional[str]] = []
     for entry in entries:
-        status_label = _label_for_status(entry.get("status"))
-        rows.append(
-            {
-                "Category": entry.get("category"),
-                "Priority": entry.get("priority") or "--",
-                "Status": status_label,
-                "Authority": entry.get("authority_name") or entry.get("authority_type") or "Triage",
-                "Last updated": _format_datetime(entry.get("updated_at")),
-                "Submitted": _format_datetime(entry.get("created_at")),
-            }
-        )
+        categories.append(entry.get("category"))
+        priorities.append(entry.get("priority") or "--")
+        statuses.append(_label_for_status(entry.get("status")))
+        authorities.append(entry.get("authority_name") or entry.get("authority_type") or "Triage")
+        updated.append(entry.get("updated_at"))
+        submitted.append(entry.get("created_at"))
+
+    return pd.DataFrame(
+        {
+            "Category": categories,
+            "Priority": priorities,
+            "Status": statuses,
+            "Authority": authorities,
+            "Last updated": _format_datetime_column(updated),
+            "Submitted": _format_datetime_column(submitted),
+        },
+        copy=False,
+    )
+
+
+def _format_datetime_column(values: List[Optional[str]]) -> pd.Series:
+    """Vectorised ``_format_datetime`` for a whole table column."""
+    import pandas as pd
 
-    df = pd.DataFrame(rows)
-    return df
+    raw = pd.Series(values, dtype="object")
+    parsed = pd.to_datetime(raw, errors="coerce", utc=True, format="ISO8601")
+    # Mirror the scalar fallbacks: blanks become a dash, unparseable values pass through.
+    fallback = raw.where(raw.notna() & (raw != ""), "—").astype(str)
+    return parsed.dt.strftime("%d %b %Y, %H:%M").fillna(fallback)
 
 
 def _format_datetime(value: Optional[str]) -> str:
@@ -1,56 +1,58 @@
 # app/frontend/components/login_page.py
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from app.core.config import settings
+from app.frontend.components._css import LOGIN_CSS, inject_css
 import json
+import random
+import time
+import warnings
+
+try:
+    from streamlit_cookies_manager import EncryptedCookieManager
+except ImportError:  # optional: without it a page refresh returns to the login form
+    EncryptedCookieManager = None
+
+API_ROOT = f"http://{settings.api_host}:{settings.api_port}"
+_TOKEN_COOKIE = "sc_token"
+
+# Pooled keep-alive session shared by every request this page makes; only
+# connection failures and idempotent requests are retried.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "http://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 502, 503]),
+    ),
+)
 
 def render_login_page():
     """Render the login page with tabs for User and Authority"""
     
     # Custom CSS for login page
-    st.markdown("""
-    <style>
-    .login-container {
-        max-width: 500px;
-        margin: 0 auto;
-        padding: 2rem;
-    }
-    .login-header {
-        text-align: center;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        margin-bottom: 2rem;
-        color: white;
-    }
-    .login-form {
-        background: rgba(255, 255, 255, 0.05);
-        padding: 2rem;
-        border-radius: 15px;
-        backdrop-filter: blur(10px);
-        border: 1px solid rgba(255, 255, 255, 0.1);
-    }
-    .stButton>button {
-        width: 100%;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        border: none;
-        padding: 0.75rem;
-        border-radius: 10px;
-        font-size: 1.1rem;
-        font-weight: bold;
-        margin-top: 1rem;
-    }
-    .stButton>button:hover {
-        opacity: 0.9;
-    }
-    .divider {
-        text-align: center;
-        margin: 1.5rem 0;
-        color: #888;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    inject_css(LOGIN_CSS)
+
+    # "Remember me" logins come back through a saved token instead of the form
+    cookies = _cookie_manager()
+    if cookies is not None:
+        if st.session_state.pop("_forget_login", False):
+            _forget_token(cookies)
+        elif _resume_saved_session(cookies):
+            st.rerun()
+
+    # One-shot banner left by the registration page
+    if flash := st.session_state.pop("flash", None):
+        level, message = flash
+        if level == "success":
+            st.success(message)
+        elif level == "error":
+            st.error(message)
+        else:
+            st.info(message)
     
     # Header
     st.markdown("""
@@ -64,10 +66,10 @@ def render_login_page():
     tab1, tab2 = st.tabs(["👤 User Login", "🏛️ Authority Login"])
 
     with tab1:
-        render_user_login()
+        render_user_login(cookies)
 
     with tab2:
-        render_authority_login()
+        render_authority_login(cookies)
     
     # Registration link
     st.markdown("<div class='divider'>Don't have an account?</div>", unsafe_allow_html=True)
@@ -75,7 +77,71 @@ def render_login_page():
         st.session_state.page = "register"
         st.rerun()
 
-def render_user_login():
+def _cookie_manager():
+    """Return a ready cookie manager, or None when the package or COOKIE_SECRET is missing."""
+    if EncryptedCookieManager is None:
+        return None
+    if not settings.cookie_secret:
+        # A made-up key would not survive a restart, leaving saved cookies
+        # unreadable, so "Remember me" stays off until one is configured.
+        warnings.warn("COOKIE_SECRET is not set; remembered logins are disabled.", stacklevel=2)
+        return None
+    cookies = EncryptedCookieManager(prefix="smartcity/", password=settings.cookie_secret)
+    if not cookies.ready():
+        # The component needs one round trip to the browser before cookies can be read
+        st.stop()
+    return cookies
+
+def _forget_token(cookies):
+    if _TOKEN_COOKIE in cookies:
+        del cookies[_TOKEN_COOKIE]
+        cookies.save()
+
+def _resume_saved_session(cookies) -> bool:
+    """Restore the session from a remembered token; True when it worked."""
+    token = cookies.get(_TOKEN_COOKIE)
+    if not token:
+        return False
+    try:
+        response = _SESSION.get(
+            f"{API_ROOT}/api/auth/session",
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=(2, 10),
+        )
+    except requests.exceptions.RequestException:
+        return False
+    if response.status_code != 200:
+        # Expired or revoked, so the next visit goes straight to the form
+        _forget_token(cookies)
+        return False
+    _start_session(response.json())
+    return True
+
+def save_remembered_login():
+    """Persist a pending "Remember me" token; call at the end of a dashboard run."""
+    token = st.session_state.get("_remember_token")
+    if not token:
+        return
+    cookies = _cookie_manager()
+    if cookies is None:
+        st.session_state.pop("_remember_token", None)
+        return
+    cookies[_TOKEN_COOKIE] = token
+    cookies.save()
+    st.session_state.pop("_remember_token", None)
+
+def _start_session(result):
+    st.session_state.logged_in = True
+    st.session_state.user_data = result["user_data"]
+    st.session_state.user_type = result["user_type"]
+    st.session_state.token = result["token"]
+    st.session_state.page = "dashboard"
+
+def _password_key(login_type):
+    # A new key after a rejected password gives an empty field; the identifier keeps its value
+    return f"{login_type}_login_password_{st.session_state.get('_login_password_rev', 0)}"
+
+def render_user_login(cookies=None):
     """Render user login form"""
     st.markdown("### 👤 User Login")
     st.write("Login with your phone number or email")
@@ -90,7 +156,8 @@ def render_user_login():
         password = st.text_input(
             "🔒 Password",
             type="password",
-            placeholder="Enter your password"
+            placeholder="Enter your password",
+            key=_password_key("user"),
         )
         
         remember_me = st.checkbox("Remember me")
@@ -101,9 +168,9 @@ def render_user_login():
             if not identifier or not password:
                 st.error("❌ Please fill in all fields")
             else:
-                perform_login(identifier, password, "user")
+                perform_login(identifier, password, "user", cookies if remember_me else None)
 
-def render_authority_login():
+def render_authority_login(cookies=None):
     """Render authority login form"""
     st.markdown("### 🏛️ Authority Login")
     st.write("Login with your registered credentials")
@@ -118,7 +185,8 @@ def render_authority_login():
         password = st.text_input(
             "🔒 Password",
             type="password",
-            placeholder="Enter your password"
+            placeholder="Enter your password",
+            key=_password_key("authority"),
         )
         
         remember_me = st.checkbox("Remember me")
@@ -129,10 +197,18 @@ def render_authority_login():
             if not identifier or not password:
                 st.error("❌ Please fill in all fields")
             else:
-                perform_login(identifier, password, "authority")
+                perform_login(identifier, password, "authority", cookies if remember_me else None)
 
-def perform_login(identifier: str, password: str, login_type: str):
+def perform_login(identifier: str, password: str, login_type: str, cookies=None):
     """Perform login API call"""
+    # Back off after failed attempts: refuse to call the API until the gate opens
+    now = time.monotonic()
+    failures = st.session_state.get("_login_fail_count", 0)
+    gate = st.session_state.get("_login_gate", 0.0)
+    if now < gate:
+        st.warning(f"⏳ Too many failed attempts. Please wait {int(gate - now) + 1}s before trying again.")
+        return
+
     with st.spinner("🔐 Authenticating..."):
         try:
             # Prepare login request
@@ -144,11 +220,16 @@ def perform_login(identifier: str, password: str, login_type: str):
             # Call login API
             endpoint = "/api/auth/login"
 
-            response = requests.post(
-                f"http://{settings.api_host}:{settings.api_port}{endpoint}",
-                json=login_data,
-                timeout=10
-            )
+            for attempt in range(3):
+                response = _SESSION.post(
+                    f"{API_ROOT}{endpoint}",
+                    json=login_data,
+                    timeout=(2, 10)  # fail fast when the backend is down
+                )
+                if response.status_code != 429 or attempt == 2:
+                    break
+                # Rate limited: retry with jittered exponential backoff
+                time.sleep(random.uniform(1, 2) * 2 ** attempt)
             
             if response.status_code == 200:
                 result = response.json()
@@ -164,11 +245,13 @@ def perform_login(identifier: str, password: str, login_type: str):
                     return
 
                 # Store user data in session state
-                st.session_state.logged_in = True
-                st.session_state.user_data = result["user_data"]
-                st.session_state.user_type = result["user_type"]
-                st.session_state.token = result["token"]
-                st.session_state.page = "dashboard"
+                st.session_state._login_fail_count = 0
+                st.session_state._login_gate = 0.0
+                _start_session(result)
+                if cookies is not None:
+                    # Saved by save_remembered_login() on the dashboard run;
+                    # st.rerun() below would cut off a save made here.
+                    st.session_state._remember_token = result["token"]
                 
                 st.success(f"✅ {result['message']}")
                 st.balloons()
@@ -177,8 +260,12 @@ def perform_login(identifier: str, password: str, login_type: str):
                 st.rerun()
                 
             elif response.status_code == 401:
+                st.session_state._login_fail_count = failures + 1
+                st.session_state._login_gate = now + min(2 ** failures, 60)
                 detail = response.json().get("detail", "Invalid credentials")
-                st.error(f"❌ {detail}")
+                st.session_state._login_password_rev = st.session_state.get("_login_password_rev", 0) + 1
+                st.session_state.flash = ("error", f"❌ {detail}")
+                st.rerun()
             else:
                 error_detail = response.json().get("detail", "Login failed")
                 st.error(f"❌ {error_detail}")
@@ -4,15 +4,21 @@
 
 from __future__ import annotations
 
-import html
+import gzip
+import hashlib
 import io
+import json
 import os
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple
 
 import requests
 import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Ensure backend packages resolve when executed via ``streamlit run``
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
@@ -22,6 +28,33 @@ if PROJECT_ROOT not in sys.path:
 
 API_BASE_URL = "http://localhost:8000/api/policy"
 
+# Summaries only need the opening of a long document, so PDF extraction stops
+# once this many characters have been read.
+_PDF_TEXT_BUDGET = 50_000
+
+# Uploads larger than this are rejected before any bytes are read or parsed.
+_MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+
+# Request bodies above this size are gzip-compressed before upload.
+_GZIP_THRESHOLD = 8192
+
+# Bullet markers and padding trimmed from summary lines (includes no-break space).
+_STRIP_CHARS = "•- \t\u00A0"
+
+# A run of non-terminators plus its closing punctuation, if any.
+_SENTENCE_RE = re.compile(r"\s*([^.!?]+[.!?]?)")
+
+# Keep-alive session for the summariser endpoint.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "http://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 502, 503]),
+    ),
+)
+
 
 def render_policy_summarizer() -> None:
     """Render a minimal interface to extract policy statements from a document."""
@@ -80,8 +113,8 @@ def render_policy_summarizer() -> None:
         policy_points = extract_policy_points(summary_text)
 
         st.subheader("Identified Policy Highlights")
-        for point in policy_points:
-            st.markdown(f"- {html.escape(point)}")
+        # Plain st.markdown does not render raw HTML, so the points need no escaping.
+        st.markdown("\n".join(f"- {point}" for point in policy_points))
 
         with st.expander("Full summary text", expanded=False):
             st.write(summary_text)
@@ -90,48 +123,58 @@ def render_policy_summarizer() -> None:
 def request_policy_summary(policy_text: str) -> Dict[str, str]:
     """Send policy text to the backend and return the JSON response."""
 
-    payload = {"text": policy_text, "summary_type": "citizen-friendly"}
+    # Key the cache on a digest so Streamlit hashes 32 hex chars, not the document.
+    digest = hashlib.blake2b(policy_text.encode("utf-8"), digest_size=16).hexdigest()
     try:
-        response = requests.post(
+        return _summarize(digest, policy_text)
+    except RuntimeError as exc:
+        return {"error": str(exc)}
+
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=64)
+def _summarize(digest: str, _policy_text: str) -> Dict[str, str]:
+    """POST the text to ``/summarize``; failures raise so they are not cached."""
+
+    payload = {"text": _policy_text, "summary_type": "citizen-friendly"}
+    body = json.dumps(payload).encode("utf-8")
+    headers = {"Content-Type": "application/json"}
+    if len(body) > _GZIP_THRESHOLD:
+        # Policy text compresses well; level 1 keeps the CPU cost negligible.
+        body = gzip.compress(body, compresslevel=1)
+        headers["Content-Encoding"] = "gzip"
+    try:
+        response = _SESSION.post(
             f"{API_BASE_URL}/summarize",
-            json=payload,
-            timeout=30,
+            data=body,
+            headers=headers,
+            timeout=(2, 30),
         )
         response.raise_for_status()
         data: Dict[str, str] = response.json()
     except requests.exceptions.RequestException as exc:
-        return {"error": f"Failed to contact the policy service: {exc}"}
-    except ValueError:
-        return {"error": "Received an invalid response from the policy service."}
+        raise RuntimeError(f"Failed to contact the policy service: {exc}") from exc
+    except ValueError as exc:
+        raise RuntimeError("Received an invalid response from the policy service.") from exc
 
     if isinstance(data, dict) and data.get("status") == "success":
         return data
 
     detail = data.get("detail") if isinstance(data, dict) else "Unexpected response format."
-    return {"error": f"Policy service returned an error: {detail}"}
+    raise RuntimeError(f"Policy service returned an error: {detail}")
 
 
 def extract_policy_points(summary_text: str) -> List[str]:
     """Convert a summary paragraph into bullet-ready policy statements."""
 
-    lines = [line.strip("•- \t ") for line in summary_text.splitlines() if line.strip()]
+    lines = [line.strip(_STRIP_CHARS) for line in summary_text.splitlines() if line.strip()]
     if lines:
         return lines
 
-    sentences: List[str] = []
-    current = []
-    for char in summary_text:
-        current.append(char)
-        if char in {".", "!", "?"}:
-            sentence = "".join(current).strip()
-            if sentence:
-                sentences.append(sentence)
-            current = []
-
-    if current:
-        sentence = "".join(current).strip()
-        if sentence:
-            sentences.append(sentence)
+    sentences = [
+        sentence
+        for sentence in (match.group(1).strip() for match in _SENTENCE_RE.finditer(summary_text))
+        if sentence
+    ]
 
     if not sentences:
         return [summary_text.strip()]
@@ -139,6 +182,23 @@ def extract_policy_points(summary_text: str) -> List[str]:
     return sentences[:8]
 
 
+@lru_cache(maxsize=1)
+def _pdf_reader_cls():
+    """Resolve the PDF reader class once; raises ImportError when neither package is installed."""
+    try:
+        from pypdf import PdfReader  # type: ignore
+    except ImportError:
+        from PyPDF2 import PdfReader  # type: ignore
+    return PdfReader
+
+
+@lru_cache(maxsize=1)
+def _docx_module():
+    import docx  # type: ignore
+
+    return docx
+
+
 def load_text_from_upload(uploaded_file) -> Tuple[str | None, str | None]:
     """Extract text from an uploaded policy document.
 
@@ -147,39 +207,51 @@ def load_text_from_upload(uploaded_file) -> Tuple[str | None, str | None]:
     readable error is provided.
     """
 
+    if (getattr(uploaded_file, "size", 0) or 0) > _MAX_UPLOAD_BYTES:
+        return None, f"File too large. Please upload a document under {_MAX_UPLOAD_BYTES // (1024 * 1024)} MB."
+
     file_bytes = uploaded_file.getvalue()
     suffix = Path(uploaded_file.name or "").suffix.lower()
 
     if suffix == ".txt" or uploaded_file.type == "text/plain":
-        for encoding in ("utf-8", "latin-1"):
-            try:
-                text = file_bytes.decode(encoding)
-                return text.strip(), None
-            except UnicodeDecodeError:
-                continue
-        return None, "Unable to decode the text file. Please ensure it is UTF-8 encoded."
+        try:
+            text = file_bytes.decode("utf-8")
+        except UnicodeDecodeError:
+            # Legacy Windows/Latin-1 exports; latin-1 maps every byte, so
+            # accented characters survive instead of becoming U+FFFD.
+            text = file_bytes.decode("latin-1")
+        return text.strip(), None
 
     if suffix == ".pdf":
         try:
-            from PyPDF2 import PdfReader  # type: ignore
+            PdfReader = _pdf_reader_cls()
         except ImportError:
-            return None, "PDF support requires the PyPDF2 package. Install it with `pip install PyPDF2`."
+            return None, "PDF support requires the pypdf package. Install it with `pip install pypdf`."
 
         reader = PdfReader(io.BytesIO(file_bytes))
-        pages = [page.extract_text() or "" for page in reader.pages]
-        text = "\n".join(pages).strip()
+        buffer = io.StringIO()
+        total = 0
+        for page in reader.pages:
+            page_text = page.extract_text() or ""
+            buffer.write(page_text)
+            buffer.write("\n")
+            total += len(page_text)
+            if total >= _PDF_TEXT_BUDGET:
+                break
+        text = buffer.getvalue().strip()
         if not text:
             return None, "No text could be extracted from the PDF. Ensure it contains selectable text."
         return text, None
 
     if suffix == ".docx":
         try:
-            import docx  # type: ignore
+            docx = _docx_module()
         except ImportError:
             return None, "Word support requires the python-docx package. Install it with `pip install python-docx`."
 
         document = docx.Document(io.BytesIO(file_bytes))
-        text = "\n".join(par.text for par in document.paragraphs).strip()
+        # python-docx yields many empty paragraphs for tables and section breaks.
+        text = "\n".join([par.text for par in document.paragraphs if par.text]).strip()
         if not text:
             return None, "The Word document does not contain readable text."
         return text, None
@@ -2,9 +2,28 @@
 import streamlit as st
 import requests
 import re
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from app.core.config import settings
+from app.frontend.components._css import REGISTRATION_CSS, inject_css
 
-AUTHORITY_ROUTE_OPTIONS = [
+API_ROOT = f"http://{settings.api_host}:{settings.api_port}"
+
+_EMAIL_RE = re.compile(r"[^@]+@[^@]+\.[^@]+")
+_DIGIT_RE = re.compile(r"\D")
+
+# Reused across reruns so sign-ups don't open a new connection each time.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "http://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 502, 503]),
+    ),
+)
+
+AUTHORITY_ROUTE_OPTIONS: tuple[str, ...] = (
     "Mayor's Office",
     "City Council",
     "Public Works Department",
@@ -12,60 +31,14 @@ AUTHORITY_ROUTE_OPTIONS = [
     "Environmental Services",
     "Health & Safety Department",
     "Housing & Urban Development",
-]
+)
+AUTHORITY_ROUTE_INDEX = {label: index for index, label in enumerate(AUTHORITY_ROUTE_OPTIONS)}
 
 def render_registration_page():
     """Render the registration page with tabs for User and Authority"""
     
     # Custom CSS for registration page
-    st.markdown("""
-    <style>
-    .register-container {
-        max-width: 600px;
-        margin: 0 auto;
-        padding: 2rem;
-    }
-    .register-header {
-        text-align: center;
-        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        margin-bottom: 2rem;
-        color: white;
-    }
-    .register-form {
-        background: rgba(255, 255, 255, 0.05);
-        padding: 2rem;
-        border-radius: 15px;
-        backdrop-filter: blur(10px);
-        border: 1px solid rgba(255, 255, 255, 0.1);
-    }
-    .form-section {
-        margin-bottom: 1.5rem;
-        padding: 1rem;
-        background: rgba(255, 255, 255, 0.02);
-        border-radius: 10px;
-    }
-    .stButton>button {
-        width: 100%;
-        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        color: white;
-        border: none;
-        padding: 0.75rem;
-        border-radius: 10px;
-        font-size: 1.1rem;
-        font-weight: bold;
-        margin-top: 1rem;
-    }
-    .info-box {
-        background: rgba(33, 150, 243, 0.1);
-        border-left: 4px solid #2196F3;
-        padding: 1rem;
-        border-radius: 5px;
-        margin: 1rem 0;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    inject_css(REGISTRATION_CSS)
     
     # Header
     st.markdown("""
@@ -124,7 +97,8 @@ def render_user_registration():
             "🏠 Address (Optional)",
             placeholder="Enter your full address",
             help="Your residential address",
-            height=100
+            height=100,
+            max_chars=255
         )
         
         st.markdown("#### Security")
@@ -156,8 +130,7 @@ def render_user_registration():
             errors = validate_user_registration(name, phone_number, email, password, confirm_password, agree_terms)
             
             if errors:
-                for error in errors:
-                    st.error(f"❌ {error}")
+                st.error("\n\n".join(f"❌ {error}" for error in errors))
             else:
                 register_user(name, phone_number, email, password, address)
 
@@ -178,6 +151,8 @@ def render_authority_registration():
         position = st.selectbox(
             "💼 Position (routing label) *",
             AUTHORITY_ROUTE_OPTIONS,
+            index=0,
+            key="auth_position",
             help="Select the citizen routing label that should deliver reports to your team",
         )
         
@@ -238,8 +213,7 @@ def render_authority_registration():
             )
             
             if errors:
-                for error in errors:
-                    st.error(f"❌ {error}")
+                st.error("\n\n".join(f"❌ {error}" for error in errors))
             else:
                 register_authority(name, position, phone_number, email, password)
 
@@ -250,10 +224,10 @@ def validate_user_registration(name, phone, email, password, confirm_password, a
     if not name or len(name.strip()) < 2:
         errors.append("Name must be at least 2 characters long")
     
-    if not phone or len(phone.strip()) < 10:
+    if not phone or len(_DIGIT_RE.sub("", phone)) < 10:
         errors.append("Phone number must be at least 10 digits")
     
-    if email and not re.match(r"[^@]+@[^@]+\.[^@]+", email):
+    if email and not _EMAIL_RE.match(email):
         errors.append("Invalid email format")
     
     if not password or len(password) < 6:
@@ -285,10 +259,10 @@ def validate_authority_registration(
     if not position or len(position.strip()) < 2:
         errors.append("Position is required")
 
-    if not phone or len(phone.strip()) < 10:
+    if not phone or len(_DIGIT_RE.sub("", phone)) < 10:
         errors.append("Phone number must be at least 10 digits")
     
-    if not email or not re.match(r"[^@]+@[^@]+\.[^@]+", email):
+    if not email or not _EMAIL_RE.match(email):
         errors.append("Valid email is required for authority registration")
     
     if not password or len(password) < 6:
@@ -316,19 +290,15 @@ def register_user(name, phone, email, password, address):
             }
             
             # Call registration API
-            response = requests.post(
-                f"http://{settings.api_host}:{settings.api_port}/api/auth/register/user",
+            response = _SESSION.post(
+                f"{API_ROOT}/api/auth/register/user",
                 json=registration_data,
-                timeout=10
+                timeout=(2, 10)
             )
             
             if response.status_code == 200:
-                st.success("✅ Registration successful! You can now login.")
-                st.balloons()
-                
-                # Redirect to login after 2 seconds
-                import time
-                time.sleep(2)
+                # Redirect straight away; the login page shows the banner once
+                st.session_state.flash = ("success", "✅ Registration successful! You can now login.")
                 st.session_state.page = "login"
                 st.rerun()
                 
@@ -358,22 +328,19 @@ def register_authority(name, position, phone, email, password):
             }
             
             # Call registration API
-            response = requests.post(
-                f"http://{settings.api_host}:{settings.api_port}/api/auth/register/authority",
+            response = _SESSION.post(
+                f"{API_ROOT}/api/auth/register/authority",
                 json=registration_data,
-                timeout=10
+                timeout=(2, 10)
             )
             
             if response.status_code == 200:
-                st.success("✅ Authority registration received!")
-                st.info(
-                    "�️ Your account is pending admin approval. We'll notify you once it's activated."
+                # Redirect straight away; the login page shows the banner once
+                st.session_state.flash = (
+                    "info",
+                    "✅ Authority registration received! "
+                    "Your account is pending admin approval. We'll notify you once it's activated.",
                 )
-                st.balloons()
-                
-                # Redirect to login after 2 seconds
-                import time
-                time.sleep(2)
                 st.session_state.page = "login"
                 st.rerun()
                 
@@ -300,6 +300,8 @@ def render_sidebar() -> str:
             st.session_state.user_type = None
             st.session_state.token = None
             st.session_state.page = "login"
+            st.session_state._forget_login = True
+            st.session_state.pop("_remember_token", None)
             st.rerun()
 
         st.markdown("<div class='sidebar-separator'></div>", unsafe_allow_html=True)
@@ -427,6 +429,9 @@ def main() -> None:
     elif selected == "Policy summarizer":
         policy_summarizer.render_policy_summarizer()
 
+    # Runs last so the cookie component is rendered on a run that completes.
+    login_page.save_remembered_login()
+
 
 if __name__ == "__main__":
     main()
@@ -1,4 +1,6 @@
 # Placeholder for main.py
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api import (
@@ -12,12 +14,23 @@ from app.api import (
 )
 from dotenv import load_dotenv
 from app.core.config import settings
+from app.core import database
+from app.core.middleware import GzipRequestMiddleware
 load_dotenv()  # Load environment variables
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Initialise the database once the server starts, not at import time."""
+    database.startup()
+    yield
+
+
 app = FastAPI(
     title="Sustainable Smart City Assistant API",
     description="AI-powered platform for urban sustainability and governance",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS middleware based on settings
@@ -28,6 +41,7 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(GzipRequestMiddleware)
 
 # Include routers
 app.include_router(auth_router.router, prefix="/api/auth", tags=["authentication"])
@@ -2,6 +2,8 @@
 from .user import (
 	Announcement,
 	ChatMessage,
+	ChatMessageArchive,
+	ChatSender,
 	Feedback,
 	FeedbackStatus,
 	User,
@@ -15,6 +17,8 @@ __all__ = [
 	"Feedback",
 	"FeedbackStatus",
 	"ChatMessage",
+	"ChatMessageArchive",
+	"ChatSender",
 	"Announcement",
 	"Base",
 ]
@@ -5,15 +5,19 @@ from datetime import datetime
 import enum
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
     Enum,
+    FetchedValue,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -21,6 +25,15 @@ from sqlalchemy.sql import func
 
 Base = declarative_base()
 
+# InnoDB with DYNAMIC rows keeps long VARCHAR/TEXT values off-page and
+# allows index prefixes up to 3072 bytes regardless of the server default.
+_MYSQL_TABLE_OPTIONS = {"mysql_engine": "InnoDB", "mysql_row_format": "DYNAMIC"}
+
+
+def _enum_values(enum_cls: type[enum.Enum]) -> list[str]:
+    """Persist enum members by value (``"reported"``) rather than by name."""
+    return [member.value for member in enum_cls]
+
 
 class UserType(enum.Enum):
     USER = "user"
@@ -33,35 +46,47 @@ class FeedbackStatus(enum.Enum):
     SOLVED = "solved"
 
 
+class ChatSender(enum.Enum):
+    USER = "user"
+    ASSISTANT = "assistant"
+    SYSTEM = "system"
+
+
 class User(Base):
     __tablename__ = "users"
     __table_args__ = (
         UniqueConstraint("email", name="uq_users_email"),
         UniqueConstraint("phone_number", name="uq_users_phone_number"),
+        _MYSQL_TABLE_OPTIONS,
     )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False)
     phone_number = Column(String(20), nullable=False)
     email = Column(String(255), nullable=True)
-    password_hash = Column(String(255), nullable=False)
-    address = Column(String(500), nullable=True)
+    # bcrypt hashes are 60 chars; 97 still fits an argon2id encoding.
+    password_hash = Column(String(97), nullable=False)
+    address = Column(String(255), nullable=True)
     department = Column(String(255), nullable=True)
     position = Column(String(255), nullable=True)
     feedback_route = Column(String(255), nullable=True)
-    user_type = Column(Enum(UserType), default=UserType.USER, nullable=False)
-    is_active = Column(Boolean, default=True, nullable=False)
-    is_approved = Column(Boolean, default=False, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    user_type = Column(
+        Enum(UserType, name="user_type", values_callable=_enum_values),
+        server_default=UserType.USER.value,
+        nullable=False,
     )
+    is_active = Column(Boolean, server_default=text("true"), nullable=False)
+    is_approved = Column(Boolean, server_default=text("false"), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     last_login = Column(DateTime(timezone=True), nullable=True)
 
+    # The foreign keys cascade in the database (SET NULL / CASCADE), so
+    # deleting a user is one statement rather than loading every child.
     feedbacks = relationship(
         "Feedback",
         back_populates="user",
-        cascade="all, delete-orphan",
+        cascade="save-update, merge",
+        passive_deletes=True,
         foreign_keys="Feedback.user_id",
     )
     assigned_feedbacks = relationship(
@@ -72,12 +97,14 @@ class User(Base):
     chat_messages = relationship(
         "ChatMessage",
         back_populates="user",
-        cascade="all, delete-orphan",
+        cascade="save-update, merge",
+        passive_deletes=True,
     )
     announcements = relationship(
         "Announcement",
         back_populates="author",
-        cascade="all, delete-orphan",
+        cascade="save-update, merge",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
@@ -88,20 +115,38 @@ class User(Base):
 
 class Feedback(Base):
     __tablename__ = "feedbacks"
+    # Each index leads with a foreign key where one is involved, so InnoDB
+    # reuses it for the constraint instead of adding a single-column one.
+    __table_args__ = (
+        Index("ix_feedbacks_status_created", "status", "created_at"),
+        Index("ix_feedbacks_user_created", "user_id", "created_at"),
+        Index("ix_feedbacks_authority_status", "authority_id", "status"),
+        _MYSQL_TABLE_OPTIONS,
+    )
 
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     authority_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
-    category = Column(String(120), nullable=False)
+    category = Column(String(64), nullable=False)
     message = Column(Text, nullable=False)
-    authority_type = Column(String(120), nullable=True)
-    priority = Column(String(50), nullable=True)
-    location = Column(String(255), nullable=True)
-    status = Column(Enum(FeedbackStatus), default=FeedbackStatus.REPORTED, nullable=False)
+    authority_type = Column(String(64), nullable=True, index=True)
+    priority = Column(String(16), nullable=True)
+    location = Column(String(200), nullable=True)
+    status = Column(
+        Enum(FeedbackStatus, name="feedback_status", values_callable=_enum_values),
+        server_default=FeedbackStatus.REPORTED.value,
+        nullable=False,
+    )
     authority_notes = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    # Owned by the database: MySQL's ON UPDATE CURRENT_TIMESTAMP at
+    # whole-second precision (see database.py). The status PATCH also stamps
+    # it explicitly so no-op updates and other engines still move it.
     updated_at = Column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+        DateTime(timezone=True),
+        server_default=func.now(),
+        server_onupdate=FetchedValue(),
+        nullable=False,
     )
 
     user = relationship("User", foreign_keys=[user_id], back_populates="feedbacks")
@@ -115,10 +160,14 @@ class Feedback(Base):
 
 class ChatMessage(Base):
     __tablename__ = "chat_messages"
+    __table_args__ = (Index("ix_chat_user_created", "user_id", "created_at"), _MYSQL_TABLE_OPTIONS)
 
-    id = Column(Integer, primary_key=True)
+    # Two rows per exchange; a 32-bit key would run out first here.
+    id = Column(BigInteger, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    sender = Column(String(20), nullable=False)
+    sender = Column(
+        Enum(ChatSender, name="chat_sender", values_callable=_enum_values), nullable=False
+    )
     message = Column(Text, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
@@ -126,11 +175,31 @@ class ChatMessage(Base):
 
     def __repr__(self) -> str:
         created = self.created_at.isoformat() if isinstance(self.created_at, datetime) else "--"
-        return f"<ChatMessage user_id={self.user_id} sender={self.sender!r} created_at={created}>"
+        return f"<ChatMessage user_id={self.user_id} sender={self.sender.value!r} created_at={created}>"
+
+
+class ChatMessageArchive(Base):
+    """Cold copy of chat messages moved out by ``database._archive_chat_messages``.
+
+    Mirrors :class:`ChatMessage` column for column so schema patches keep both
+    in step; no foreign key, so archived rows outlive their users' cascades.
+    """
+
+    __tablename__ = "chat_messages_archive"
+    __table_args__ = (_MYSQL_TABLE_OPTIONS,)
+
+    id = Column(BigInteger, primary_key=True, autoincrement=False)
+    user_id = Column(Integer, nullable=False)
+    sender = Column(
+        Enum(ChatSender, name="chat_sender", values_callable=_enum_values), nullable=False
+    )
+    message = Column(Text, nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False)
 
 
 class Announcement(Base):
     __tablename__ = "announcements"
+    __table_args__ = (Index("ix_announcements_created", "created_at"), _MYSQL_TABLE_OPTIONS)
 
     id = Column(Integer, primary_key=True)
     title = Column(String(255), nullable=False)
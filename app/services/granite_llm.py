@@ -1,5 +1,5 @@
 import json
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
 
 import requests
 
@@ -112,6 +112,54 @@ class GraniteLLM:
             print(f"[Granite LLM] General Error: {e}")
             return None
 
+    def _stream_request(self, prompt: str, max_tokens: int = 500) -> Iterator[str]:
+        """Yield generated text fragments from the Watsonx streaming endpoint"""
+        if not self.token or not self.project_id:
+            return
+
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "text/event-stream",
+            "Authorization": f"Bearer {self.token}",
+        }
+
+        payload = {
+            "model_id": self.model_id or DEFAULT_MODEL_ID,
+            "input": prompt,
+            "project_id": self.project_id,
+            "parameters": {
+                "decoding_method": "greedy",
+                "max_new_tokens": max_tokens,
+                "temperature": 0.7,
+                "top_k": 50,
+                "top_p": 1.0,
+                "repetition_penalty": 1.1,
+            },
+        }
+
+        try:
+            with requests.post(
+                f"{self.url}/ml/v1/text/generation_stream?version={FOUNDATION_MODELS_VERSION}",
+                headers=headers,
+                json=payload,
+                stream=True,
+                timeout=30,
+            ) as response:
+                response.raise_for_status()
+                # Server-sent events: each "data:" line carries one JSON fragment.
+                for line in response.iter_lines(decode_unicode=True):
+                    if not line or not line.startswith("data:"):
+                        continue
+                    try:
+                        event = json.loads(line[len("data:"):].strip())
+                    except ValueError:
+                        continue
+                    text = (event.get("results") or [{}])[0].get("generated_text", "")
+                    if text:
+                        yield text
+        except Exception as e:
+            print(f"[Granite LLM] Stream Error: {e}")
+
     def _load_available_models(self) -> set[str]:
         """Fetch the available Granite models for the current tenant."""
         headers = {"Authorization": f"Bearer {self.token}"}
@@ -179,6 +227,15 @@ class GraniteLLM:
         response = self._make_request(prompt, max_tokens=200)
         return response or f"Here are some general tips for {topic}: reduce consumption, reuse materials, and recycle properly."
 
+    def stream_eco_tip(self, topic: str) -> Iterator[str]:
+        prompt = f"""Generate 3 practical, actionable eco-friendly tips related to "{topic}" for city residents:\n\nTips:"""
+        streamed = False
+        for chunk in self._stream_request(prompt, max_tokens=200):
+            streamed = True
+            yield chunk
+        if not streamed:
+            yield self.generate_eco_tip(topic)
+
     def generate_city_report(self, city_name: str, kpi_data: Dict[str, Any]) -> str:
         prompt = f"""Generate a comprehensive sustainability report for {city_name} based on the following KPI data:\n\n{json.dumps(kpi_data, indent=2)}\n\nReport:"""
         response = self._make_request(prompt, max_tokens=800)
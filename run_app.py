@@ -1,4 +1,6 @@
 # Placeholder for run_app.py
+import shutil
+import socket
 import subprocess
 import sys
 import time
@@ -6,23 +8,92 @@ import threading
 import os
 from app.core.config import settings
 
+# Upper bound on how long the frontend waits for the API to start listening
+BACKEND_START_TIMEOUT = 30.0
+
+def entry_point(name):
+    """Command prefix for a console script, via ``python -m`` if not on PATH"""
+    script = shutil.which(name)
+    return [script] if script else [sys.executable, "-m", name]
+
+# Resolved once at startup
+UVICORN = entry_point("uvicorn")
+STREAMLIT = entry_point("streamlit")
+
+def backend_workers():
+    """Number of uvicorn worker processes to pre-fork outside debug mode"""
+    if not settings.jwt_secret_key:
+        # Each worker would mint its own ephemeral JWT secret and reject
+        # tokens issued by the others.
+        return 1
+    return settings.api_workers or os.cpu_count() or 2
+
+def backend_args(workers):
+    """uvicorn CLI flags: file watching in debug, pre-forked workers otherwise"""
+    args = ["--host", settings.api_host, "--port", str(settings.api_port)]
+    if settings.debug:
+        args.append("--reload")
+    else:
+        args += ["--workers", str(workers)]
+    return args
+
+def port_open():
+    """True once something accepts connections on the API port"""
+    try:
+        with socket.create_connection((settings.api_host, settings.api_port), timeout=0.5):
+            return True
+    except OSError:
+        return False
+
 def run_backend():
-    """Run FastAPI backend"""
+    """Start the FastAPI backend; returns (ready, alive, stop) callables"""
     print("🚀 Starting FastAPI backend...")
-    subprocess.run([
-        sys.executable, "-m", "uvicorn",
+    workers = backend_workers()
+    if settings.debug or workers > 1:
+        # Migrate once here rather than in every worker's lifespan.
+        from app.core import database
+
+        database.prepare()
+        database.get_engine().dispose()  # the launcher serves no queries
+        env = {**os.environ, database.PREPARED_ENV: "1"}
+        # The reloader and the worker supervisor both need their own process.
+        process = subprocess.Popen([*UVICORN, "app.main:app", *backend_args(workers)], env=env)
+        return port_open, lambda: process.poll() is None, process.terminate
+
+    import uvicorn
+
+    # "auto" picks uvloop/httptools when uvicorn[standard] is installed.
+    config = uvicorn.Config(
         "app.main:app",
-        "--host", settings.api_host,
-        "--port", str(settings.api_port),
-        "--reload"
-    ])
+        host=settings.api_host,
+        port=settings.api_port,
+        loop="auto",
+        http="auto",
+    )
+    server = uvicorn.Server(config)
+    # uvicorn skips installing signal handlers off the main thread.
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+
+    def stop():
+        server.should_exit = True
+
+    return (lambda: server.started), thread.is_alive, stop
+
+def wait_for_backend(ready, alive):
+    """Block until the API is listening; False if it exited or timed out"""
+    deadline = time.monotonic() + BACKEND_START_TIMEOUT
+    while not ready():
+        if not alive() or time.monotonic() > deadline:
+            return False
+        time.sleep(0.05)
+    return True
 
 def run_frontend():
     """Run Streamlit frontend"""
     print("🎨 Starting Streamlit frontend...")
-    time.sleep(3)  # Wait for backend to start
     subprocess.run([
-        sys.executable, "-m", "streamlit", "run",
+        *STREAMLIT, "run",
         "app/frontend/smart_dashboard.py",
         "--server.port", str(settings.frontend_port),
         "--server.address", "localhost"
@@ -40,11 +111,13 @@ def main():
         print("See .env.example for reference.")
         return
     
+    stop_backend = None
     try:
-        # Start backend in a separate thread
-        backend_thread = threading.Thread(target=run_backend, daemon=True)
-        backend_thread.start()
-        
+        ready, alive, stop_backend = run_backend()
+        if not wait_for_backend(ready, alive):
+            print("❌ Backend failed to start.")
+            return
+
         # Start frontend in main thread
         run_frontend()
         
@@ -52,6 +125,9 @@ def main():
         print("\n🛑 Shutting down application...")
     except Exception as e:
         print(f"❌ Error starting application: {e}")
+    finally:
+        if stop_backend is not None:
+            stop_backend()
 
 if __name__ == "__main__":
     main()